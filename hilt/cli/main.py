@@ -1,5 +1,5 @@
 import argparse
-import json
+from collections import deque
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import cast
@@ -9,6 +9,8 @@ from hilt.core.actor import Actor
 from hilt.core.event import Content, Event
 from hilt.instrumentation.auto import instrument, uninstrument
 from hilt.instrumentation.context import get_context
+from hilt.io.reader import iter_jsonl_lines
+from hilt.utils.serialization import loads
 
 
 def _demo_event() -> int:
@@ -34,13 +36,13 @@ def _tail_file(path: Path, n: int) -> int:
     if not path.exists():
         print(f"❌ File not found: {path}")
         return 1
-    with path.open("r", encoding="utf-8") as f:
-        lines = f.readlines()[-n:]
+    # Stream the file and keep only the last n lines in memory
+    lines = deque(iter_jsonl_lines(path), maxlen=max(n, 0))
     for line in lines:
         try:
-            print(json.loads(line))
+            print(loads(line))
         except Exception:
-            print(line.rstrip())
+            print(line.decode("utf-8", errors="replace").rstrip())
     return 0
 
 
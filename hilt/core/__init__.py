@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from hilt.core.actor import Actor
-from hilt.core.event import Content, Event, Metrics
+from hilt.core.event import Content, Event, Metrics, RawEvent
 from hilt.core.exceptions import HILTError, SessionError, ValidationError
 
 __all__ = [
     "Event",
     "Content",
     "Metrics",
+    "RawEvent",
     "Actor",
     "HILTError",
     "ValidationError",
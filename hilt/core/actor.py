@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
-ALLOWED_ACTOR_TYPES = {"human", "agent", "tool", "system"}
+ALLOWED_ACTOR_TYPES: frozenset[str] = frozenset({"human", "agent", "tool", "system"})
 
 
 @dataclass
@@ -41,6 +42,8 @@ class Actor:
             raise ValueError(
                 f"Invalid actor type '{self.type}'. Allowed types: {sorted(ALLOWED_ACTOR_TYPES)}"
             )
+        # Actor types come from a small closed set, so actors share one string object
+        self.type = sys.intern(self.type)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert Actor to dictionary."""
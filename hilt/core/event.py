@@ -2,26 +2,30 @@
 
 from __future__ import annotations
 
-import json
-import uuid
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
 from hilt.core.actor import Actor
+from hilt.utils.serialization import dumps
 from hilt.utils.timestamp import get_utc_timestamp
-
-ALLOWED_ACTIONS = {
-    "prompt",
-    "completion",
-    "completion_chunk",
-    "retrieval",
-    "tool_call",
-    "tool_result",
-    "system",
-    "feedback",
-}
+from hilt.utils.uuid import uuid4_str
+
+ALLOWED_ACTIONS: frozenset[str] = frozenset(
+    {
+        "prompt",
+        "completion",
+        "completion_chunk",
+        "retrieval",
+        "tool_call",
+        "tool_result",
+        "system",
+        "feedback",
+    }
+)
 
 
 class Content(BaseModel):
@@ -54,7 +58,7 @@ class Event(BaseModel):
     """
 
     hilt_version: str = Field(default="1.0.0")
-    event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = Field(default_factory=uuid4_str)
     timestamp: datetime = Field(default_factory=get_utc_timestamp)
     session_id: str
     actor: Actor
@@ -79,7 +83,8 @@ class Event(BaseModel):
     def validate_action(cls, v: str) -> str:
         if v not in ALLOWED_ACTIONS:
             raise ValueError(f"Invalid action '{v}'. Allowed actions: {sorted(ALLOWED_ACTIONS)}")
-        return v
+        # Actions come from a small closed set, so events share one string object
+        return sys.intern(v)
 
     @field_validator("content", mode="before")
     @classmethod
@@ -119,7 +124,11 @@ class Event(BaseModel):
 
     def to_json(self) -> str:
         """Convert Event to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return self.to_json_bytes().decode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        """Convert Event to UTF-8 encoded JSON bytes."""
+        return dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Event:
@@ -131,13 +140,68 @@ class Event(BaseModel):
         return cls(**data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> Event:
-        """Create Event from JSON string."""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+    def from_json(cls, json_str: str | bytes) -> Event:
+        """Create Event from JSON string or UTF-8 bytes.
+
+        Parsing and validation happen in a single pydantic-core pass, without
+        building an intermediate Python dict.
+        """
+        return cls.model_validate_json(json_str)
 
     class Config:
         arbitrary_types_allowed = True
 
 
-__all__ = ["Event", "Content", "Metrics"]
+@dataclass(slots=True, frozen=True)
+class RawEvent:
+    """
+    Lightweight, unvalidated view of a serialized event.
+
+    Used by ``Session.read_raw()`` to scan large logs without paying for
+    pydantic validation. Nested sections stay plain dictionaries and the
+    timestamp stays an ISO 8601 string; call :meth:`to_event` to obtain a
+    validated :class:`Event`.
+    """
+
+    event_id: str
+    timestamp: str
+    session_id: str
+    actor: dict[str, Any]
+    action: str
+    content: dict[str, Any] | None = None
+    metrics: dict[str, Any] | None = None
+    provenance: dict[str, Any] | None = None
+    extensions: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RawEvent:
+        """Create RawEvent from a serialized event dictionary."""
+        return cls(
+            event_id=data["event_id"],
+            timestamp=data["timestamp"],
+            session_id=data["session_id"],
+            actor=data["actor"],
+            action=data["action"],
+            content=data.get("content"),
+            metrics=data.get("metrics"),
+            provenance=data.get("provenance"),
+            extensions=data.get("extensions"),
+        )
+
+    def to_event(self) -> Event:
+        """Validate and convert to a full Event."""
+        data: dict[str, Any] = {
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "session_id": self.session_id,
+            "actor": self.actor,
+            "action": self.action,
+            "content": self.content,
+            "metrics": self.metrics,
+            "provenance": self.provenance,
+            "extensions": self.extensions,
+        }
+        return Event.from_dict(data)
+
+
+__all__ = ["Event", "Content", "Metrics", "RawEvent"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import time
 from collections.abc import Callable
 from types import ModuleType
@@ -17,16 +18,25 @@ from hilt.integrations.openai import (
     _generate_conversation_uuid,
     _log_system_event,
     _unwrap_message_content,
-    _usage_value,
+    _usage_values,
 )
 
-chat_completions_module: ModuleType | None
-try:  # pragma: no cover - runtime import guard
-    chat_completions_module = importlib.import_module("openai.resources.chat.completions")
-except ImportError:  # pragma: no cover - optional dependency
-    chat_completions_module = None
+# The OpenAI SDK takes a few hundred milliseconds to import, so it is only
+# loaded when instrumentation is actually enabled.
+chat_completions_module: ModuleType | None = None
 
-OPENAI_AVAILABLE = chat_completions_module is not None
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+
+def _load_chat_completions_module() -> ModuleType:
+    """Import (once) and return the OpenAI chat completions module."""
+    global chat_completions_module
+    if chat_completions_module is None:
+        try:
+            chat_completions_module = importlib.import_module("openai.resources.chat.completions")
+        except ImportError as e:  # pragma: no cover - broken or partial install
+            raise ImportError("OpenAI chat completions module unavailable") from e
+    return chat_completions_module
 
 
 class OpenAIInstrumentor:
@@ -44,10 +54,7 @@ class OpenAIInstrumentor:
         if self._is_instrumented:
             return
 
-        if chat_completions_module is None:
-            raise ImportError("OpenAI chat completions module unavailable")
-
-        completions_module = cast(Any, chat_completions_module)
+        completions_module = cast(Any, _load_chat_completions_module())
 
         # Conserve la méthode d'origine
         original = getattr(completions_module.Completions, "create")
@@ -123,9 +130,7 @@ class OpenAIInstrumentor:
             assistant_message = _unwrap_message_content(message)
             usage = getattr(response, "usage", None)
 
-            prompt_tokens = _usage_value(usage, "prompt_tokens")
-            completion_tokens = _usage_value(usage, "completion_tokens")
-            total_tokens = _usage_value(usage, "total_tokens")
+            prompt_tokens, completion_tokens, total_tokens = _usage_values(usage)
 
             cost_usd = _calculate_cost(model, prompt_tokens, completion_tokens)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib
 import uuid
 from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from hilt.core.actor import Actor
@@ -21,21 +22,38 @@ MODEL_PRICING = {
     "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
 }
 
+# Per-token (input, output) rates derived once from the per-million prices above
+_MODEL_COST_PER_TOKEN: dict[str, tuple[float, float]] = {
+    model: (prices["input"] / 1_000_000, prices["output"] / 1_000_000)
+    for model, prices in MODEL_PRICING.items()
+}
+_DEFAULT_COST_PER_TOKEN = _MODEL_COST_PER_TOKEN["gpt-4o-mini"]
+
 
 def _calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
     """Calculate API call cost."""
-    pricing = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4o-mini"])
-    input_cost = (prompt_tokens * pricing["input"]) / 1_000_000
-    output_cost = (completion_tokens * pricing["output"]) / 1_000_000
-    return input_cost + output_cost
+    input_rate, output_rate = _MODEL_COST_PER_TOKEN.get(model, _DEFAULT_COST_PER_TOKEN)
+    return prompt_tokens * input_rate + completion_tokens * output_rate
 
 
+@lru_cache(maxsize=4096)
 def _generate_conversation_uuid(session_id: str) -> str:
     """Generate deterministic conversation UUID."""
     conversation_uuid = uuid.uuid5(HILT_NAMESPACE, session_id)
     return f"conv_{conversation_uuid.hex[:12]}"
 
 
+# Message fragments checked in order when an error carries no status code
+_STATUS_CODE_HINTS = (
+    ("429", 429),
+    ("rate limit", 429),
+    ("401", 401),
+    ("403", 403),
+    ("400", 400),
+    ("503", 503),
+)
+
+
 def _extract_status_code(error: Exception) -> int:
     """Extract HTTP status code from error."""
     status_attr = getattr(error, "status_code", None)
@@ -47,16 +65,9 @@ def _extract_status_code(error: Exception) -> int:
         return 429
 
     error_str = str(error).lower()
-    if "429" in error_str or "rate limit" in error_str:
-        return 429
-    elif "401" in error_str:
-        return 401
-    elif "403" in error_str:
-        return 403
-    elif "400" in error_str:
-        return 400
-    elif "503" in error_str:
-        return 503
+    for hint, status_code in _STATUS_CODE_HINTS:
+        if hint in error_str:
+            return status_code
 
     return 500
 
@@ -76,16 +87,36 @@ def _unwrap_message_content(message: Any) -> str:
     return str(content)
 
 
+_MISSING = object()
+
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+_get_usage_tokens = attrgetter(*_USAGE_KEYS)
+
+
 def _usage_value(usage: Any, key: str) -> int:
     """Extract usage value."""
-    if hasattr(usage, key):
-        value = getattr(usage, key)
+    value: Any = getattr(usage, key, _MISSING)
+    if value is not _MISSING:
         return int(value or 0)
     if isinstance(usage, dict):
         return int(usage.get(key, 0) or 0)
     return 0
 
 
+def _usage_values(usage: Any) -> tuple[int, int, int]:
+    """Extract prompt, completion and total token counts in one lookup."""
+    try:
+        prompt, completion, total = _get_usage_tokens(usage)
+    except AttributeError:
+        # Dict payloads, partial usage objects or missing usage
+        return (
+            _usage_value(usage, "prompt_tokens"),
+            _usage_value(usage, "completion_tokens"),
+            _usage_value(usage, "total_tokens"),
+        )
+    return int(prompt or 0), int(completion or 0), int(total or 0)
+
+
 @lru_cache(maxsize=1)
 def _get_rate_limit_error() -> type[Exception] | None:
     """Return OpenAI's RateLimitError class if available."""
@@ -137,5 +168,6 @@ __all__ = [
     "_extract_status_code",
     "_unwrap_message_content",
     "_usage_value",
+    "_usage_values",
     "_log_system_event",
 ]
@@ -1,5 +1,5 @@
 """I/O operations for HILT files."""
 
-from hilt.io.session import Session
+from hilt.io.session import Session, clear_sheets_cache
 
-__all__ = ["Session"]
+__all__ = ["Session", "clear_sheets_cache"]
@@ -0,0 +1,57 @@
+"""Low-level JSONL reading helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+# Number of bytes read per call when scanning a file for lines.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_jsonl_lines(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the raw lines of a JSONL file, without their trailing newline.
+
+    The file is read in binary chunks of ``chunk_size`` bytes and scanned for
+    ``\\n`` boundaries, so memory use stays bounded regardless of file size.
+    Plain reads are used rather than memory mapping because logs can be
+    truncated by another process while they are being read; a mapped file
+    would then crash the interpreter with SIGBUS instead of ending early.
+
+    Args:
+        path: Path to the JSONL file.
+        chunk_size: Number of bytes per read call.
+
+    Yields:
+        Each line of the file as ``bytes``, including blank lines.
+    """
+    with path.open("rb", buffering=0) as f:
+        yield from _iter_chunked_lines(f, chunk_size)
+
+
+def _iter_chunked_lines(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yield lines from a binary stream read in fixed-size chunks."""
+    buffer = bytearray()
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        start = 0
+        # Slice through a memoryview so each line is copied once, not twice;
+        # the view must be released before the buffer is resized below.
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                yield view[start:end].tobytes()
+                start = end + 1
+        # Keep only the unterminated tail for the next chunk
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "iter_jsonl_lines"]
@@ -1,17 +1,29 @@
 """Session manager for reading/writing HILT events."""
 
+import atexit
+import codecs
+import hashlib
 import json
 import os
+import queue
 import re
-from collections.abc import Iterator
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from types import TracebackType
-from typing import Any, TextIO, cast
+from typing import Any, BinaryIO, cast
 
-from hilt.core.event import Event
+from hilt.core.event import Event, RawEvent
 from hilt.core.exceptions import HILTError
-from hilt.utils.timestamp import get_utc_timestamp
+from hilt.io.reader import iter_jsonl_lines
+from hilt.utils.serialization import dumps_line, loads
+from hilt.utils.timestamp import get_utc_timestamp, parse_timestamp
+
+_WHITESPACE_RE = re.compile(r"\s+")
 
 # All available columns for Google Sheets and local filtering
 ALL_COLUMNS = [
@@ -31,22 +43,81 @@ ALL_COLUMNS = [
     "model",
     "relevance_score",
 ]
+ALL_COLUMNS_SET: frozenset[str] = frozenset(ALL_COLUMNS)
 
+# Upper bounds for one append_many() write (local) and API call (sheets)
+BATCH_MAX_BYTES = 128 * 1024
+SHEETS_BATCH_ROWS = 500
+# Rows kept for retry after failed sheets requests before the oldest are dropped
+SHEETS_MAX_PENDING_ROWS = 5000
+# Encoded payloads queued for the background writer before append() blocks
+WRITER_QUEUE_SIZE = 1024
 
-def _format_cost_number(value: float | None) -> str | None:
-    """Format cost with six decimals (dot separator)."""
-    if value is None:
-        return None
-    return f"{value:.6f}"
 
+# Parent directories already created by a Session in this process
+_ENSURED_DIRS: set[Path] = set()
 
-def _format_cost_display(value: float | None) -> str | None:
-    """Format cost as localized string with currency (e.g., 0,000065 USD)."""
-    if value is None:
-        return None
-    formatted = _format_cost_number(value)
-    if formatted is None:
-        return None
+
+def _ensure_parent_dir(path: Path) -> None:
+    """Create ``path``'s parent directory once per process."""
+    parent = path.parent
+    if parent not in _ENSURED_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+
+# gspread client and (spreadsheet, worksheet) handles shared by sheets sessions
+_SHEETS_CACHE_LOCK = threading.Lock()
+_SHEETS_CLIENTS: dict[tuple[str, ...], Any] = {}
+_SHEETS_WORKSHEETS: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+_SHEETS_HEADERS_OK: set[tuple[Any, ...]] = set()
+
+
+def clear_sheets_cache() -> None:
+    """Forget the gspread clients, worksheets and header checks shared by sheets sessions.
+
+    The next sheets session authorizes and opens its worksheet again, e.g.
+    after credentials were rotated or a worksheet was recreated.
+    """
+    with _SHEETS_CACHE_LOCK:
+        _SHEETS_CLIENTS.clear()
+        _SHEETS_WORKSHEETS.clear()
+        _SHEETS_HEADERS_OK.clear()
+
+
+def _credentials_cache_key(
+    credentials_path: str | None, credentials_json: dict[str, Any] | None
+) -> tuple[str, ...]:
+    """Identify the credentials a sheets session authenticates with."""
+    if credentials_json:
+        # Hash the whole service account info; its identifying fields are optional
+        encoded = json.dumps(credentials_json, sort_keys=True, default=str).encode()
+        return ("info", hashlib.sha256(encoded).hexdigest())
+    path = credentials_path or os.getenv("GOOGLE_CREDENTIALS_PATH") or ""
+    if not path:
+        return ("file", "")
+    path = os.path.abspath(path)
+    try:
+        # A rewritten credentials file gets a new client
+        mtime = str(os.stat(path).st_mtime_ns)
+    except OSError:
+        mtime = ""
+    return ("file", path, mtime)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer setting from the environment."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+
+
+def _format_cost_display(formatted: str) -> str:
+    """Turn a formatted cost into a localized string with currency (e.g., 0,000065 USD)."""
     return formatted.replace(".", ",") + " USD"
 
 
@@ -74,91 +145,128 @@ def _parse_timestamp(value: Any) -> datetime:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str) and value:
-        candidate = value.replace("Z", "+00:00")
         try:
-            return datetime.fromisoformat(candidate)
+            return parse_timestamp(value)
         except ValueError:
             pass
     return get_utc_timestamp()
 
 
-def _event_column_values(event: Event) -> dict[str, Any]:
-    """Extract flattened column values from an event."""
-    actor_type = event.actor.type
-    actor_id = event.actor.id
-    speaker = f"{actor_type}: {actor_id}"
-
-    # Format timestamp
+def _column_timestamp(event: Event) -> Any:
+    """Timestamp formatted for display."""
     if hasattr(event.timestamp, "strftime"):
-        timestamp_str = event.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    else:
-        timestamp_str = str(event.timestamp)
+        return event.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    return str(event.timestamp)
 
-    conversation_id = event.session_id
-    event_id = event.event_id
 
-    # Session short display
+def _column_session(event: Event) -> Any:
+    """Short conversation display name."""
+    conversation_id = event.session_id
     if conversation_id.startswith("conv_"):
-        session_display: str = f"Conv.{conversation_id[5:13]}"
-    elif conversation_id.startswith("rag_chat_"):
-        session_display = conversation_id.replace("rag_chat_", "Conv.")
-    else:
-        session_display = conversation_id[:12]
+        return f"Conv.{conversation_id[5:13]}"
+    if conversation_id.startswith("rag_chat_"):
+        return conversation_id.replace("rag_chat_", "Conv.")
+    return conversation_id[:12]
 
-    # Message content (sanitize newlines/length)
+
+def _column_message(event: Event) -> Any:
+    """Message content with newlines/whitespace collapsed and length capped."""
     raw_message = (event.content.text if event.content else "") or ""
     message = raw_message.replace("\n", " ")
-    message = re.sub(r"\s+", " ", message).strip()
+    message = _WHITESPACE_RE.sub(" ", message).strip()
     if len(message) > 500:
         message = message[:497] + "..."
+    return message
+
+
+def _column_tokens(key: str) -> Callable[[Event], Any]:
+    """Build an extractor for one entry of ``metrics.tokens``."""
+
+    def extract(event: Event) -> Any:
+        metrics = event.metrics
+        tokens = metrics.tokens if metrics is not None else None
+        return tokens.get(key, "") if tokens else ""
+
+    return extract
+
+
+def _column_cost_usd(event: Event) -> Any:
+    """Cost formatted with six decimals."""
+    metrics = event.metrics
+    cost_val = metrics.cost_usd if metrics is not None else None
+    return "" if cost_val is None else f"{cost_val:.6f}"
 
-    # Metrics
-    tokens_in: Any = ""
-    tokens_out: Any = ""
-    cost_usd = ""
-    if event.metrics:
-        tokens_dict = getattr(event.metrics, "tokens", None)
-        if isinstance(tokens_dict, dict):
-            if "prompt" in tokens_dict:
-                prompt_val = tokens_dict["prompt"]
-                tokens_in = prompt_val
-            if "completion" in tokens_dict:
-                completion_val = tokens_dict["completion"]
-                tokens_out = completion_val
-
-        cost_val = getattr(event.metrics, "cost_usd", None)
-        if isinstance(cost_val, (int, float)):
-            formatted = _format_cost_number(float(cost_val))
-            if formatted is not None:
-                cost_usd = formatted
-
-    # Extensions
+
+def _column_extension(key: str) -> Callable[[Event], Any]:
+    """Build an extractor for one ``extensions`` entry ("" when missing)."""
+
+    def extract(event: Event) -> Any:
+        extensions = event.extensions or {}
+        return extensions.get(key, "")
+
+    return extract
+
+
+def _column_reply_to(event: Event) -> Any:
+    """Parent event id ("" when missing or None)."""
     extensions = event.extensions or {}
     reply_to = extensions.get("reply_to")
-    if reply_to is None:
-        reply_to = ""
-    status_code = extensions.get("status_code", "")
-    latency_ms = extensions.get("latency_ms", "")
-    model = extensions.get("model", "")
-    relevance_score = extensions.get("score", extensions.get("relevance_score", ""))
-
-    return {
-        "timestamp": timestamp_str,
-        "conversation_id": conversation_id,
-        "event_id": event_id,
-        "reply_to": reply_to,
-        "status_code": status_code,
-        "session": session_display,
-        "speaker": speaker,
-        "action": event.action,
-        "message": message,
-        "tokens_in": tokens_in,
-        "tokens_out": tokens_out,
-        "cost_usd": cost_usd,
-        "latency_ms": latency_ms,
-        "model": model,
-        "relevance_score": relevance_score,
-    }
+    return "" if reply_to is None else reply_to
+
+
+def _column_relevance_score(event: Event) -> Any:
+    """Relevance score, accepting either the ``score`` or ``relevance_score`` key."""
+    extensions = event.extensions or {}
+    return extensions.get("score", extensions.get("relevance_score", ""))
+
+
+# Column name -> extractor, resolved once per Session so each event only pays
+# for the columns that are actually selected.
+_COLUMN_EXTRACTORS: dict[str, Callable[[Event], Any]] = {
+    "timestamp": _column_timestamp,
+    "conversation_id": lambda event: event.session_id,
+    "event_id": lambda event: event.event_id,
+    "reply_to": _column_reply_to,
+    "status_code": _column_extension("status_code"),
+    "session": _column_session,
+    "speaker": lambda event: f"{event.actor.type}: {event.actor.id}",
+    "action": lambda event: event.action,
+    "message": _column_message,
+    "tokens_in": _column_tokens("prompt"),
+    "tokens_out": _column_tokens("completion"),
+    "cost_usd": _column_cost_usd,
+    "latency_ms": _column_extension("latency_ms"),
+    "model": _column_extension("model"),
+    "relevance_score": _column_relevance_score,
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_column_getters(
+    columns: tuple[str, ...]
+) -> tuple[tuple[str, Callable[[Event], Any]], ...]:
+    """Validate a column selection and pair each column with its extractor.
+
+    Cached so sessions created with the same selection skip both steps.
+    """
+    invalid_cols = [col for col in columns if col not in ALL_COLUMNS_SET]
+    if invalid_cols:
+        raise ValueError(f"Invalid columns: {invalid_cols}. " f"Available columns: {ALL_COLUMNS}")
+    return tuple((col, _COLUMN_EXTRACTORS[col]) for col in columns)
+
+
+# Buffered sessions not closed yet; their pending events are written at exit
+_UNCLOSED_SESSIONS: weakref.WeakSet["Session"] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_unclosed_sessions() -> None:
+    """Write the buffered tail of sessions the program never closed."""
+    for session in list(_UNCLOSED_SESSIONS):
+        try:
+            session.close()
+        except Exception as e:
+            print(f"   ⚠️  Unable to write buffered events at exit: {e}")
 
 
 class Session:
@@ -173,6 +281,11 @@ class Session:
         backend: 'local' or 'sheets'
         filepath: Path to JSONL file (for local backend)
         columns: List of columns to display (for both backends)
+        buffer_size: Bytes of encoded events to buffer before writing (local backend)
+        flush_interval_ms: Maximum age of buffered events before a write (local backend)
+        durability: Whether flush() and close() fsync the file after writing (local backend)
+        background_writes: Whether a writer thread performs file writes (local backend)
+        sheets_batch_size: Rows to collect before each append to the sheet (sheets backend)
     """
 
     def __init__(
@@ -183,6 +296,10 @@ class Session:
         mode: str = "a",
         create_dirs: bool = True,
         encoding: str = "utf-8",
+        buffer_size: int | None = None,
+        flush_interval_ms: int | None = None,
+        durability: bool = False,
+        background_writes: bool = False,
         # Explicit backend parameter
         backend: str | None = None,
         # Google Sheets backend parameters
@@ -190,20 +307,76 @@ class Session:
         credentials_path: str | None = None,
         credentials_json: dict[str, Any] | None = None,
         worksheet_name: str = "Logs",
+        sheets_batch_size: int | None = None,
         # Column filtering (now available for both backends)
         columns: list[str] | None = None,
     ):
-        """Initialize Session with local or Google Sheets backend."""
+        """Initialize Session with local or Google Sheets backend.
+
+        For the local backend, ``buffer_size`` controls write coalescing: encoded
+        events are accumulated in memory and written in a single call once the
+        buffer reaches ``buffer_size`` bytes (and on ``close()``). The default of
+        ``0`` writes every event as soon as it is appended.
+
+        When ``flush_interval_ms`` is set, an append also writes the buffer if
+        the previous write is older than that many milliseconds, bounding how
+        long events stay in memory during steady traffic.
+
+        Both settings default to the ``HILT_BUFFER_SIZE`` and
+        ``HILT_FLUSH_INTERVAL_MS`` environment variables, then to ``0``.
+
+        With ``background_writes=True``, ``append()`` only encodes the event and
+        queues it; a writer thread applies the buffering settings above and
+        performs the file writes. ``flush()`` waits for the queue to drain, and
+        write errors are raised from the next ``append()``, ``flush()`` or
+        ``close()``.
+
+        For the sheets backend, ``sheets_batch_size`` rows are collected and
+        sent in one ``append_rows`` request (``flush_interval_ms`` also applies).
+        It defaults to ``HILT_SHEETS_BATCH_SIZE``, then to ``1``, which keeps
+        one request per event for real-time updates.
+
+        Call ``flush()`` to write buffered events before the session closes.
+        Buffered sessions still open at interpreter exit are closed by an
+        ``atexit`` hook; a process killed by a signal loses the buffered tail.
+        With ``durability=True``, ``flush()`` and ``close()`` also call
+        ``os.fsync`` so the written events survive a crash or power loss, at the
+        cost of a disk sync.
+        """
+        if flush_interval_ms is None:
+            flush_interval_ms = _env_int("HILT_FLUSH_INTERVAL_MS", 0)
+        if flush_interval_ms < 0:
+            raise ValueError("flush_interval_ms must be >= 0")
 
         self.filepath: Path | None = None
         self.columns: list[str] | None = None
         self.sheets_client: Any | None = None
         self.spreadsheet: Any | None = None
         self.sheet_id: str | None = None
+        self._sheets_cache_key: tuple[Any, ...] | None = None
         self.worksheet: Any | None = None
         self.mode: str = mode
         self.encoding: str = encoding
-        self._file_handle: TextIO | None = None
+        self._utf8: bool = codecs.lookup(encoding).name == "utf-8"
+        self._encoder: codecs.IncrementalEncoder | None = None
+        self.buffer_size: int = 0
+        self.flush_interval_ms: int = flush_interval_ms
+        self.durability: bool = durability
+        self.background_writes: bool = background_writes
+        self._writer_queue: queue.Queue[bytes | None] | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        self._writer_failures = 0
+        # Guards _writer_error and _writer_failures between writer and callers
+        self._writer_error_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._file_handle: BinaryIO | None = None
+        self._create_dirs = False
+        self._column_getters: tuple[tuple[str, Callable[[Event], Any]], ...] = ()
+        self._write_buffer = bytearray()
+        self.sheets_batch_size: int = 1
+        self._pending_rows: list[list[str]] = []
+        self._write_lock = threading.Lock()
         # Determine backend and filepath from arguments
         resolved_backend = backend
         resolved_filepath = filepath
@@ -227,28 +400,51 @@ class Session:
 
         self.backend = resolved_backend
 
+        # Resolve batching settings only for the backend that uses them, so a
+        # setting meant for the other backend never rejects this session
+        if self.backend == "local":
+            if buffer_size is None:
+                buffer_size = _env_int("HILT_BUFFER_SIZE", 0)
+            if buffer_size < 0:
+                raise ValueError("buffer_size must be >= 0")
+            self.buffer_size = buffer_size
+        else:
+            if sheets_batch_size is None:
+                sheets_batch_size = _env_int("HILT_SHEETS_BATCH_SIZE", 1)
+            if sheets_batch_size < 1:
+                raise ValueError("sheets_batch_size must be >= 1")
+            self.sheets_batch_size = sheets_batch_size
+
         # Set and validate columns for both backends
         if columns is not None:
             selected_columns = list(columns)
-            # Validate columns
-            invalid_cols = [col for col in selected_columns if col not in ALL_COLUMNS]
-            if invalid_cols:
-                raise ValueError(
-                    f"Invalid columns: {invalid_cols}. " f"Available columns: {ALL_COLUMNS}"
-                )
+            # Validate columns and resolve their extractors (cached per selection)
+            self._column_getters = _resolve_column_getters(tuple(selected_columns))
             self.columns = selected_columns
         else:
             # Default to all columns for sheets, None for local (no filtering)
             if self.backend == "sheets":
                 self.columns = ALL_COLUMNS.copy()
+                self._column_getters = _resolve_column_getters(tuple(ALL_COLUMNS))
             else:
                 self.columns = None
+                self._column_getters = ()
 
         # Initialize based on backend
         if self.backend == "local":
             self._init_local_backend(resolved_filepath, mode, create_dirs, encoding)
         elif self.backend == "sheets":
             self._init_sheets_backend(sheet_id, credentials_path, credentials_json, worksheet_name)
+            self._close_at_exit()
+
+    def _close_at_exit(self) -> None:
+        """Close this session at interpreter exit if it buffers events."""
+        if self.backend == "local":
+            buffered = self.buffer_size > 0 or self.background_writes
+        else:
+            buffered = self.sheets_batch_size > 1
+        if buffered:
+            _UNCLOSED_SESSIONS.add(self)
 
     def _require_columns(self) -> list[str]:
         """Return configured columns or raise if they are missing."""
@@ -272,10 +468,12 @@ class Session:
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
+        self._utf8 = codecs.lookup(encoding).name == "utf-8"
         self._file_handle = None
+        self._create_dirs = create_dirs and mode in ("a", "w")
 
-        if create_dirs and mode in ("a", "w"):
-            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        if self._create_dirs:
+            _ensure_parent_dir(self.filepath)
 
     def _init_sheets_backend(
         self,
@@ -304,55 +502,74 @@ class Session:
                 "Install with: pip install hilt[sheets]"
             )
 
-        # Get credentials
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ]
-
-        if credentials_json:
-            creds = Credentials.from_service_account_info(credentials_json, scopes=scopes)
-        elif credentials_path:
-            creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-        else:
-            creds_path = os.getenv("GOOGLE_CREDENTIALS_PATH")
-            if creds_path:
-                creds = Credentials.from_service_account_file(creds_path, scopes=scopes)
+        # Reuse the client and worksheet handles opened earlier in this process
+        creds_key = _credentials_cache_key(credentials_path, credentials_json)
+        worksheet_key = (creds_key, sheet_id, worksheet_name)
+        with _SHEETS_CACHE_LOCK:
+            client = _SHEETS_CLIENTS.get(creds_key)
+            cached_worksheet = _SHEETS_WORKSHEETS.get(worksheet_key)
+
+        if client is None:
+            # Get credentials
+            scopes = [
+                "https://www.googleapis.com/auth/spreadsheets",
+                "https://www.googleapis.com/auth/drive",
+            ]
+
+            if credentials_json:
+                creds = Credentials.from_service_account_info(credentials_json, scopes=scopes)
+            elif credentials_path:
+                creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
             else:
-                raise ValueError(
-                    "credentials_path or credentials_json is required for backend='sheets'. "
-                    "Provide it as parameter or set GOOGLE_CREDENTIALS_PATH environment variable."
-                )
-
-        # Initialize client
-        self.sheets_client = gspread.authorize(creds)
-        self.sheet_id = sheet_id
+                creds_path = os.getenv("GOOGLE_CREDENTIALS_PATH")
+                if creds_path:
+                    creds = Credentials.from_service_account_file(creds_path, scopes=scopes)
+                else:
+                    raise ValueError(
+                        "credentials_path or credentials_json is required for backend='sheets'. "
+                        "Provide it as parameter or set GOOGLE_CREDENTIALS_PATH environment "
+                        "variable."
+                    )
 
-        try:
-            spreadsheet = self.sheets_client.open_by_key(sheet_id)
-        except gspread.exceptions.SpreadsheetNotFound:
-            raise ValueError(
-                f"Google Spreadsheet with ID '{sheet_id}' not found. "
-                "Make sure the sheet exists and is shared with your service account."
-            )
-        self.spreadsheet = spreadsheet
+            # Initialize client
+            client = gspread.authorize(creds)
+            with _SHEETS_CACHE_LOCK:
+                client = _SHEETS_CLIENTS.setdefault(creds_key, client)
 
+        self.sheets_client = client
+        self.sheet_id = sheet_id
         self.worksheet_name = worksheet_name
+        self._sheets_cache_key = worksheet_key
 
-        # Get or create worksheet
-        try:
-            self.worksheet = spreadsheet.worksheet(worksheet_name)
-            print(f"   ✅ Worksheet '{worksheet_name}' found")
-        except gspread.exceptions.WorksheetNotFound:
-            print(f"   ⚠️  Worksheet '{worksheet_name}' not found, creating...")
+        if cached_worksheet is not None:
+            self.spreadsheet, self.worksheet = cached_worksheet
+        else:
             try:
-                columns = self._require_columns()
-                self.worksheet = spreadsheet.add_worksheet(
-                    title=worksheet_name, rows=1000, cols=len(columns)
+                spreadsheet = client.open_by_key(sheet_id)
+            except gspread.exceptions.SpreadsheetNotFound:
+                raise ValueError(
+                    f"Google Spreadsheet with ID '{sheet_id}' not found. "
+                    "Make sure the sheet exists and is shared with your service account."
                 )
-                print(f"   ✅ Worksheet '{worksheet_name}' created successfully!")
-            except Exception as e:
-                raise HILTError(f"Failed to create worksheet '{worksheet_name}': {e}") from e
+            self.spreadsheet = spreadsheet
+
+            # Get or create worksheet
+            try:
+                self.worksheet = spreadsheet.worksheet(worksheet_name)
+                print(f"   ✅ Worksheet '{worksheet_name}' found")
+            except gspread.exceptions.WorksheetNotFound:
+                print(f"   ⚠️  Worksheet '{worksheet_name}' not found, creating...")
+                try:
+                    columns = self._require_columns()
+                    self.worksheet = spreadsheet.add_worksheet(
+                        title=worksheet_name, rows=1000, cols=len(columns)
+                    )
+                    print(f"   ✅ Worksheet '{worksheet_name}' created successfully!")
+                except Exception as e:
+                    raise HILTError(f"Failed to create worksheet '{worksheet_name}': {e}") from e
+
+            with _SHEETS_CACHE_LOCK:
+                _SHEETS_WORKSHEETS[worksheet_key] = (self.spreadsheet, self.worksheet)
 
         # Ensure headers
         self._ensure_sheet_headers()
@@ -367,13 +584,20 @@ class Session:
         worksheet = self._require_worksheet()
         headers = self._require_columns()
 
+        # Headers already checked by an earlier session in this process
+        headers_key = (self.sheet_id, self.worksheet_name, tuple(headers))
+        with _SHEETS_CACHE_LOCK:
+            if headers_key in _SHEETS_HEADERS_OK:
+                return
+
         try:
-            all_values = worksheet.get_all_values()
+            # Only the header row is needed, not the whole sheet
+            first_row = worksheet.row_values(1)
 
-            if not all_values:
+            if not first_row:
                 worksheet.update("A1", [headers])
                 print("   ✅ Headers added to Google Sheets")
-            elif not all_values[0] or all_values[0] != headers:
+            elif first_row != headers:
                 end_col = _col_to_a1(len(headers))
                 range_name = f"A1:{end_col}1"
                 worksheet.update(range_name, [headers])
@@ -400,13 +624,31 @@ class Session:
                 print("   ✅ Headers added (fallback method)")
             except Exception as e2:
                 print(f"   ⚠️  Unable to add headers: {e2}")
+                self._evict_sheets_cache()
+                return
+
+        with _SHEETS_CACHE_LOCK:
+            _SHEETS_HEADERS_OK.add(headers_key)
+
+    def _evict_sheets_cache(self) -> None:
+        """Drop the shared worksheet and header check after a failed sheets API call."""
+        worksheet_key = self._sheets_cache_key
+        if worksheet_key is None:
+            return
+        sheet = worksheet_key[1:]
+        with _SHEETS_CACHE_LOCK:
+            _SHEETS_WORKSHEETS.pop(worksheet_key, None)
+            for key in [key for key in _SHEETS_HEADERS_OK if key[:2] == sheet]:
+                _SHEETS_HEADERS_OK.discard(key)
 
     def __enter__(self) -> "Session":
         """Context manager entry."""
         if self.backend == "local":
             if self.filepath is None:
                 raise HILTError("Session filepath is not set for local backend.")
-            self._file_handle = cast(TextIO, open(self.filepath, self.mode, encoding=self.encoding))
+            self._file_handle = self._open_file(self.filepath)
+            self._start_writer()
+            self._close_at_exit()
         return self
 
     def __exit__(
@@ -423,7 +665,47 @@ class Session:
         if self.backend == "local" and self._file_handle is None:
             if self.filepath is None:
                 raise HILTError("Session filepath is not set for local backend.")
-            self._file_handle = cast(TextIO, open(self.filepath, self.mode, encoding=self.encoding))
+            self._file_handle = self._open_file(self.filepath)
+            self._start_writer()
+            self._close_at_exit()
+
+    def _open_file(self, path: Path) -> BinaryIO:
+        """Open the local file unbuffered so each flush is exactly one write() call.
+
+        In append mode the descriptor carries O_APPEND, so every write of whole
+        JSONL lines lands at the end of the file without interleaving with
+        writes from other sessions or processes appending to the same file.
+        """
+        try:
+            handle = cast(BinaryIO, open(path, self.mode + "b", buffering=0))
+        except FileNotFoundError:
+            if not self._create_dirs:
+                raise
+            # The directory was removed after it was first created; recreate it
+            _ENSURED_DIRS.discard(path.parent)
+            _ensure_parent_dir(path)
+            handle = cast(BinaryIO, open(path, self.mode + "b", buffering=0))
+        if not self._utf8:
+            self._start_encoder(handle)
+        return handle
+
+    def _start_encoder(self, handle: BinaryIO) -> None:
+        """Set up the session encoder for a newly opened non-UTF-8 file.
+
+        As with a text-mode file, encodings that carry a byte order mark
+        (``utf-16``, ``utf-8-sig``) write it once at the start of an empty
+        file, not in front of every line.
+        """
+        encoder = codecs.getincrementalencoder(self.encoding)()
+        if os.fstat(handle.fileno()).st_size:
+            encoder.setstate(0)
+        else:
+            bom = encoder.encode("")
+            if bom:
+                # Written together with the first events
+                with self._write_lock:
+                    self._write_buffer[:0] = bom
+        self._encoder = encoder
 
     def append(self, event: Event) -> None:
         """Append an event to the backend."""
@@ -432,68 +714,269 @@ class Session:
         elif self.backend == "sheets":
             self._append_to_sheets(event)
 
+    def append_many(self, events: Iterable[Event]) -> None:
+        """Append several events in order as one batch.
+
+        The local backend encodes the events into one contiguous payload and
+        hands it to the file in a single write; the sheets backend sends them
+        in one ``append_rows`` call. Events are consumed lazily, so large
+        iterables are split into batches of about ``BATCH_MAX_BYTES`` (local)
+        or ``SHEETS_BATCH_ROWS`` rows (sheets) to keep memory bounded.
+        """
+        if self.backend == "local":
+            self._append_many_to_file(events)
+        elif self.backend == "sheets":
+            self._append_many_to_sheets(events)
+
     def _append_to_file(self, event: Event) -> None:
         """Append event to local file with optional column filtering."""
         if self._file_handle is None:
             raise HILTError("Session not opened. Use context manager or call open().")
 
         try:
-            if self.columns is None:
-                # No filtering - write full event as JSON with formatted cost display
-                data = event.to_dict()
-                metrics = data.get("metrics")
-                if isinstance(metrics, dict):
-                    raw_cost = metrics.get("cost_usd")
-                    formatted = (
-                        _format_cost_number(raw_cost)
-                        if isinstance(raw_cost, (int, float))
-                        else None
-                    )
-                    display = (
-                        _format_cost_display(raw_cost)
-                        if isinstance(raw_cost, (int, float))
-                        else None
-                    )
-                    if formatted is not None:
-                        metrics["cost_usd"] = formatted
-                    if display:
-                        metrics["cost_usd_display"] = display
-                json_line = json.dumps(data, ensure_ascii=False)
-            else:
-                # Filter event data to include only specified columns
-                filtered_data = self._event_to_filtered_dict(event)
-                json_line = json.dumps(filtered_data, ensure_ascii=False)
-
-            self._file_handle.write(json_line + "\n")
-            self._file_handle.flush()
+            self._write_encoded(self._encode_event(event))
         except Exception as e:
             raise HILTError(f"Failed to write event: {e}") from e
 
+    def _append_many_to_file(self, events: Iterable[Event]) -> None:
+        """Append events to the local file in contiguous payloads."""
+        if self._file_handle is None:
+            raise HILTError("Session not opened. Use context manager or call open().")
+
+        try:
+            payload = bytearray()
+            for event in events:
+                payload += self._encode_event(event)
+                if len(payload) >= BATCH_MAX_BYTES:
+                    self._write_encoded(payload)
+                    payload.clear()
+            if payload:
+                self._write_encoded(payload)
+        except Exception as e:
+            raise HILTError(f"Failed to write events: {e}") from e
+
+    def _encode_event(self, event: Event) -> bytes:
+        """Encode one event as a JSONL line in the session encoding."""
+        if self.columns is None:
+            # No filtering - write full event as JSON with formatted cost display
+            data = event.to_dict()
+            metrics = data.get("metrics")
+            if isinstance(metrics, dict):
+                raw_cost = metrics.get("cost_usd")
+                if isinstance(raw_cost, (int, float)):
+                    # Format once; the display string is derived from it
+                    formatted = f"{raw_cost:.6f}"
+                    metrics["cost_usd"] = formatted
+                    metrics["cost_usd_display"] = _format_cost_display(formatted)
+            encoded = dumps_line(data)
+        else:
+            # Filter event data to include only specified columns
+            filtered_data = self._event_to_filtered_dict(event)
+            encoded = dumps_line(filtered_data)
+
+        if not self._utf8:
+            encoder = self._encoder
+            if encoder is None:
+                raise HILTError("Session not opened. Use context manager or call open().")
+            encoded = encoder.encode(encoded.decode("utf-8"))
+        return encoded
+
+    def _write_encoded(self, encoded: bytes | bytearray) -> None:
+        """Hand encoded lines to the writer thread, or write them directly."""
+        if self._writer_queue is None:
+            self._write_now(encoded)
+            return
+        # Copy bytearray payloads: append_many() reuses its buffer
+        self._writer_queue.put(bytes(encoded))
+        # Queue first so this event is still written; the error is an earlier one
+        self._raise_writer_error()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread if background writes are enabled."""
+        if not self.background_writes or self._writer_thread is not None:
+            return
+        with self._writer_error_lock:
+            self._writer_error = None
+            self._writer_failures = 0
+        self._writer_queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(
+            target=self._drain_writer_queue, name="hilt-session-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _drain_writer_queue(self) -> None:
+        """Writer thread loop: write queued lines until the stop sentinel arrives."""
+        writer_queue = self._writer_queue
+        if writer_queue is None:
+            return
+        while True:
+            encoded = writer_queue.get()
+            try:
+                if encoded is None:
+                    return
+                self._write_now(encoded)
+            except BaseException as e:
+                # Keep writing later payloads; report the first error on the caller side
+                with self._writer_error_lock:
+                    self._writer_failures += 1
+                    if self._writer_error is None:
+                        self._writer_error = e
+            finally:
+                writer_queue.task_done()
+
+    def _stop_writer(self) -> None:
+        """Write everything queued so far and stop the writer thread."""
+        if self._writer_queue is None or self._writer_thread is None:
+            return
+        self._writer_queue.put(None)
+        self._writer_thread.join()
+        self._writer_queue = None
+        self._writer_thread = None
+
+    def _raise_writer_error(self) -> None:
+        """Re-raise a failure from the writer thread in the calling thread."""
+        if self._writer_error is None:
+            # Unlocked fast path for append(); both fields are set under the lock
+            return
+        with self._writer_error_lock:
+            error = self._writer_error
+            failures = self._writer_failures
+            self._writer_error = None
+            self._writer_failures = 0
+        if error is not None:
+            raise HILTError(
+                f"Background write of {failures} earlier queued payload(s) failed; "
+                f"first error: {error}"
+            ) from error
+
+    def _write_now(self, encoded: bytes | bytearray) -> None:
+        """Buffer encoded lines and write them once the buffer is due."""
+        with self._write_lock:
+            if not self._write_buffer and len(encoded) >= self.buffer_size:
+                # Nothing pending and the lines fill the buffer on their own
+                # (always the case when unbuffered): write them as they are
+                # instead of copying them through the write buffer
+                try:
+                    self._write_all(encoded)
+                finally:
+                    self._last_flush = time.monotonic()
+                return
+            self._write_buffer += encoded
+            if len(self._write_buffer) >= self.buffer_size or self._flush_interval_elapsed():
+                self._flush_write_buffer()
+
+    def _flush_interval_elapsed(self) -> bool:
+        """Return True if buffered events have waited longer than flush_interval_ms."""
+        if not self.flush_interval_ms:
+            return False
+        return (time.monotonic() - self._last_flush) * 1000 >= self.flush_interval_ms
+
+    def _flush_write_buffer(self) -> None:
+        """Write buffered events to the file in a single call (caller holds the lock).
+
+        Only bytes the file accepted leave the buffer, so after a failed write
+        the next flush (or close) retries the rest.
+        """
+        buffer = self._write_buffer
+        if not buffer or self._file_handle is None:
+            return
+        try:
+            # Short writes are rare on regular files; finish the remainder
+            while buffer:
+                del buffer[: self._write_some(buffer)]
+        finally:
+            self._last_flush = time.monotonic()
+
+    def _write_all(self, data: bytes | bytearray) -> None:
+        """Write ``data`` to the open file, finishing any short writes.
+
+        If a write fails, the unwritten tail moves to the write buffer so the
+        next flush retries it (caller holds the lock).
+        """
+        written = 0
+        try:
+            written = self._write_some(data)
+            while written < len(data):
+                written += self._write_some(data[written:])
+        except BaseException:
+            self._write_buffer += data[written:]
+            raise
+
+    def _write_some(self, data: bytes | bytearray) -> int:
+        """Issue one write() call and return the number of bytes written."""
+        handle = self._file_handle
+        if handle is None:
+            raise HILTError("Session not opened. Use context manager or call open().")
+        return handle.write(data)
+
     def _event_to_filtered_dict(self, event: Event) -> dict[str, Any]:
         """Convert Event to filtered dictionary with only selected columns."""
-        columns = self._require_columns()
-        values = _event_column_values(event)
-        return {col: values.get(col, "") for col in columns}
+        self._require_columns()
+        return {col: extract(event) for col, extract in self._column_getters}
 
     def _append_to_sheets(self, event: Event) -> None:
         """
-        Append event to Google Sheets immediately (real-time).
+        Append event to Google Sheets.
 
-        This implementation writes each event directly to Google Sheets
-        without buffering, enabling real-time data visibility.
+        By default each event is written directly to Google Sheets without
+        buffering, enabling real-time data visibility. With a larger
+        ``sheets_batch_size`` rows are sent together in one request.
         """
         try:
-            worksheet = self._require_worksheet()
             row = self._event_to_sheet_row(event)
-            worksheet.append_row(row, value_input_option="USER_ENTERED")
+            with self._write_lock:
+                self._pending_rows.append(row)
+                if (
+                    len(self._pending_rows) >= self.sheets_batch_size
+                    or self._flush_interval_elapsed()
+                ):
+                    self._flush_pending_rows()
+        except Exception as e:
+            raise HILTError(f"Failed to write to Google Sheets: {e}") from e
+
+    def _append_many_to_sheets(self, events: Iterable[Event]) -> None:
+        """Append events to Google Sheets, one API call per batch of rows."""
+        try:
+            with self._write_lock:
+                for event in events:
+                    self._pending_rows.append(self._event_to_sheet_row(event))
+                    if len(self._pending_rows) >= SHEETS_BATCH_ROWS:
+                        self._flush_pending_rows()
+                self._flush_pending_rows()
         except Exception as e:
             raise HILTError(f"Failed to write to Google Sheets: {e}") from e
 
+    def _flush_pending_rows(self) -> None:
+        """Send pending rows in a single append_rows request (caller holds the lock).
+
+        Rows stay pending if the request fails, and the error is raised. The
+        next append or flush retries them, so a caller should not append the
+        same event again after the error. At most ``SHEETS_MAX_PENDING_ROWS``
+        rows (or one batch, if larger) are kept; beyond that the oldest rows
+        are dropped and the error says how many.
+        """
+        if not self._pending_rows:
+            return
+        try:
+            worksheet = self._require_worksheet()
+            worksheet.append_rows(self._pending_rows, value_input_option="USER_ENTERED")
+            self._pending_rows = []
+        except Exception as e:
+            # The cached worksheet may be stale; the next session opens it again
+            self._evict_sheets_cache()
+            limit = max(SHEETS_MAX_PENDING_ROWS, self.sheets_batch_size)
+            dropped = len(self._pending_rows) - limit
+            if dropped > 0:
+                del self._pending_rows[:dropped]
+                raise HILTError(f"{e} (dropped {dropped} oldest pending rows)") from e
+            raise
+        finally:
+            self._last_flush = time.monotonic()
+
     def _event_to_sheet_row(self, event: Event) -> list[str]:
         """Convert Event to Google Sheets row with only selected columns."""
-        columns = self._require_columns()
-        values = _event_column_values(event)
-        return [_stringify(values.get(col, "")) for col in columns]
+        self._require_columns()
+        return [_stringify(extract(event)) for _, extract in self._column_getters]
 
     def read(self) -> Iterator[Event]:
         """Read all events from the backend."""
@@ -510,23 +993,58 @@ class Session:
         if not path.exists():
             raise HILTError(f"File not found: {path}")
 
-        with path.open(encoding=self.encoding) as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
+        for line_num, raw_line in enumerate(self._iter_raw_lines(path), start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
 
-                try:
-                    if self.columns is None:
-                        # Full event format
-                        event = Event.from_json(line)
-                    else:
-                        # Filtered format - reconstruct minimal event
-                        data = json.loads(line)
-                        event = self._filtered_dict_to_event(data)
-                    yield event
-                except Exception as e:
-                    raise HILTError(f"Invalid event at line {line_num}: {e}") from e
+            try:
+                if self.columns is None:
+                    # Full event format
+                    event = Event.from_json(line)
+                else:
+                    # Filtered format - reconstruct minimal event
+                    data = loads(line)
+                    event = self._filtered_dict_to_event(data)
+                yield event
+            except Exception as e:
+                raise HILTError(f"Invalid event at line {line_num}: {e}") from e
+
+    def read_raw(self) -> Iterator[RawEvent]:
+        """
+        Read full events from a local file without pydantic validation.
+
+        Much cheaper than ``read()`` in time and memory when scanning large
+        logs for a few fields. Only available for the local backend with full
+        events (``columns=None``).
+        """
+        if self.backend != "local" or self.columns is not None:
+            raise HILTError(
+                "read_raw() requires the local backend with full events (columns=None)."
+            )
+        if self.filepath is None:
+            raise HILTError("Session filepath is not set for local backend.")
+        path = self.filepath
+        if not path.exists():
+            raise HILTError(f"File not found: {path}")
+
+        for line_num, raw_line in enumerate(self._iter_raw_lines(path), start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            try:
+                yield RawEvent.from_dict(loads(line))
+            except Exception as e:
+                raise HILTError(f"Invalid event at line {line_num}: {e}") from e
+
+    def _iter_raw_lines(self, path: Path) -> Iterator[bytes | str]:
+        """Iterate over raw lines, streaming bytes when the file is UTF-8 encoded."""
+        if self._utf8:
+            yield from iter_jsonl_lines(path)
+        else:
+            with path.open(encoding=self.encoding) as f:
+                yield from f
 
     def _filtered_dict_to_event(self, data: dict[str, Any]) -> Event:
         """Reconstruct Event from filtered dictionary."""
@@ -571,7 +1089,11 @@ class Session:
         """Read events from Google Sheets."""
         try:
             worksheet = self._require_worksheet()
-            records: list[dict[str, Any]] = worksheet.get_all_records()
+            try:
+                records: list[dict[str, Any]] = worksheet.get_all_records()
+            except Exception:
+                self._evict_sheets_cache()
+                raise
 
             for record in records:
                 # Parse speaker
@@ -616,11 +1138,47 @@ class Session:
         except Exception as e:
             raise HILTError(f"Error reading from Google Sheets: {e}") from e
 
+    def flush(self) -> None:
+        """Write any buffered events now without closing the session.
+
+        With ``durability=True`` the file is also fsynced, making this an
+        explicit checkpoint for long-running sessions.
+        """
+        if self.backend == "sheets":
+            try:
+                with self._write_lock:
+                    self._flush_pending_rows()
+            except Exception as e:
+                raise HILTError(f"Failed to write to Google Sheets: {e}") from e
+        elif self.backend == "local" and self._file_handle is not None:
+            if self._writer_queue is not None:
+                # Wait until the writer thread has handled everything queued so far
+                self._writer_queue.join()
+                self._raise_writer_error()
+            try:
+                with self._write_lock:
+                    self._flush_write_buffer()
+                    if self.durability:
+                        os.fsync(self._file_handle.fileno())
+            except Exception as e:
+                raise HILTError(f"Failed to write buffered events: {e}") from e
+
     def close(self) -> None:
         """Close the session and flush any pending data."""
-        if self.backend == "local" and self._file_handle is not None:
-            self._file_handle.close()
-            self._file_handle = None
+        if self.backend == "sheets":
+            self.flush()
+            _UNCLOSED_SESSIONS.discard(self)
+        elif self.backend == "local" and self._file_handle is not None:
+            _UNCLOSED_SESSIONS.discard(self)
+            try:
+                self._stop_writer()
+                self.flush()
+                self._raise_writer_error()
+            finally:
+                self._stop_writer()
+                if self._file_handle is not None:
+                    self._file_handle.close()
+                    self._file_handle = None
 
 
 __all__ = ["Session"]
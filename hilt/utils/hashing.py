@@ -3,27 +3,60 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
+import importlib
+from types import ModuleType
+from typing import Any
 
 HASH_PREFIX = "sha256:"
+BLAKE3_PREFIX = "blake3:"
 
+blake3_module: ModuleType | None
+try:  # pragma: no cover - runtime import guard
+    blake3_module = importlib.import_module("blake3")
+except ImportError:  # pragma: no cover - optional dependency
+    blake3_module = None
 
-def hash_content(content: str) -> str:
-    """Return a namespaced SHA-256 hash for the given content string.
+SUPPORTED_ALGORITHMS = ("sha256", "blake3")
+
+
+def hash_content(content: str, algorithm: str = "sha256") -> str:
+    """Return a namespaced hash for the given content string.
 
     Args:
         content: Arbitrary text content to hash.
+        algorithm: ``"sha256"`` (default) or ``"blake3"``. BLAKE3 requires the
+            optional ``blake3`` package and is considerably faster on CPUs with
+            SIMD support.
 
     Returns:
-        A string of the form ``sha256:<digest>`` where ``<digest>`` is the
-        hexadecimal SHA-256 digest of ``content``.
+        A string of the form ``<algorithm>:<digest>`` where ``<digest>`` is the
+        hexadecimal digest of ``content``.
+
+    Raises:
+        ValueError: If ``algorithm`` is not supported.
+        ImportError: If ``algorithm`` is ``"blake3"`` and ``blake3`` is missing.
     """
-    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
-    return f"{HASH_PREFIX}{digest}"
+    data = content.encode("utf-8")
+    if algorithm == "sha256":
+        return HASH_PREFIX + hashlib.sha256(data).hexdigest()
+    if algorithm == "blake3":
+        if blake3_module is None:
+            raise ImportError(
+                "BLAKE3 hashing requires an additional dependency. Install with: pip install blake3"
+            )
+        hasher: Any = blake3_module.blake3(data)
+        return BLAKE3_PREFIX + str(hasher.hexdigest())
+    raise ValueError(
+        f"Unsupported hash algorithm '{algorithm}'. Supported: {list(SUPPORTED_ALGORITHMS)}"
+    )
 
 
 def verify_hash(content: str, hash_str: str) -> bool:
     """Verify whether the provided content matches the given hash string.
 
+    The comparison runs in constant time.
+
     Args:
         content: Text content to validate.
         hash_str: A hash string produced by :func:`hash_content`.
@@ -32,9 +65,12 @@ def verify_hash(content: str, hash_str: str) -> bool:
         ``True`` if ``content`` matches ``hash_str``; ``False`` otherwise.
 
     Raises:
-        ValueError: If ``hash_str`` does not use the expected prefix.
+        ValueError: If ``hash_str`` does not use a supported prefix.
+        ImportError: If ``hash_str`` is a ``blake3:`` hash and ``blake3`` is missing.
     """
-    if not hash_str.startswith(HASH_PREFIX):
-        raise ValueError("Hash must start with 'sha256:'.")
-    expected = hash_content(content)
-    return expected == hash_str
+    algorithm, separator, _ = hash_str.partition(":")
+    if not separator or algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError("Hash must start with 'sha256:' or 'blake3:'.")
+    expected = hash_content(content, algorithm)
+    # compare_digest() rejects non-ASCII str, so compare the encoded bytes
+    return hmac.compare_digest(expected.encode(), hash_str.encode("utf-8", "surrogatepass"))
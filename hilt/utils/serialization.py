@@ -0,0 +1,113 @@
+"""JSON helpers that use orjson when it is installed.
+
+Both implementations encode the same JSON values: values the json module
+does not know (datetimes, UUIDs, enums, dataclasses) go through one shared
+``default`` hook, NaN and infinity are written as ``null``, and integers
+beyond 64 bits are written in full. The text can still differ in float
+formatting (orjson writes ``1e-7`` where the json module writes ``1e-07``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from types import ModuleType
+from typing import Any
+from uuid import UUID
+
+orjson_module: ModuleType | None
+try:  # pragma: no cover - runtime import guard
+    orjson_module = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - optional dependency
+    orjson_module = None
+
+ORJSON_AVAILABLE = orjson_module is not None
+
+
+def _default(obj: Any) -> Any:
+    """Convert values JSON has no type for, the way orjson does natively."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _replace_non_finite(dataclasses.asdict(obj))
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Return ``obj`` with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+# json.dumps() builds a new encoder for every call with non-default options
+_encode = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_default
+).encode
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` with the json module."""
+    try:
+        return _encode(obj)
+    except ValueError as e:
+        if "Out of range float" not in str(e):
+            raise
+        # NaN and infinity are not JSON; write them as null like orjson does
+        return _encode(_replace_non_finite(obj))
+
+
+if orjson_module is not None:
+    _orjson: Any = orjson_module
+    _DUMPS_OPTIONS: int = _orjson.OPT_NON_STR_KEYS
+    _DUMPS_LINE_OPTIONS: int = _DUMPS_OPTIONS | _orjson.OPT_APPEND_NEWLINE
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+        try:
+            result: bytes = _orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits; the json module writes them
+            return _json_dumps(obj).encode("utf-8")
+        return result
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize ``obj`` to a UTF-8 encoded JSONL line (with trailing newline)."""
+        try:
+            result: bytes = _orjson.dumps(obj, default=_default, option=_DUMPS_LINE_OPTIONS)
+        except TypeError:
+            return (_json_dumps(obj) + "\n").encode("utf-8")
+        return result
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize a JSON document from bytes or text."""
+        return _orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+        return _json_dumps(obj).encode("utf-8")
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize ``obj`` to a UTF-8 encoded JSONL line (with trailing newline)."""
+        return (_json_dumps(obj) + "\n").encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize a JSON document from bytes or text."""
+        return json.loads(data)
+
+
+__all__ = ["ORJSON_AVAILABLE", "dumps", "dumps_line", "loads"]
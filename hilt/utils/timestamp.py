@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 def get_utc_timestamp() -> datetime:
@@ -10,13 +12,32 @@ def get_utc_timestamp() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# (epoch second, formatted date and time) of the last now_iso8601() call
+_last_second: tuple[int, str] = (-1, "")
+
+
 def now_iso8601() -> str:
-    """Get the current UTC timestamp as ISO 8601 string with trailing 'Z'."""
-    return get_utc_timestamp().isoformat().replace("+00:00", "Z")
+    """Get the current UTC timestamp as ISO 8601 string with trailing 'Z'.
 
+    The date and time part only changes once per second, so it is formatted
+    once and reused; only the microseconds are formatted on every call.
+    """
+    global _last_second
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _last_second
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _last_second = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}Z"
 
+
+@lru_cache(maxsize=1024)
 def parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO format timestamp string."""
+    """Parse ISO format timestamp string.
+
+    Results are cached: logs often repeat the same timestamp on adjacent
+    lines, and the returned datetime is immutable.
+    """
     return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
 
 
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import os
 import uuid
 
+_urandom = os.urandom
+
+
+def uuid4_str() -> str:
+    """Return a random (version 4) UUID string.
+
+    Equivalent to ``str(uuid.uuid4())`` without building a ``UUID`` object:
+    the version and variant bits are set directly on 16 random bytes.
+    """
+    raw = bytearray(_urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 def generate_event_id() -> str:
     """Return a sortable UUID string suitable for HILT events.
 
-    Prefers UUIDv7 when available (Python 3.11+). Falls back to UUID4 on
-    older versions of Python by generating a random UUID.
+    Prefers UUIDv7 when available (Python 3.14+). Falls back to a random
+    UUID4 on older versions of Python.
 
     Returns:
         A string representation of the generated UUID.
@@ -17,4 +33,4 @@ def generate_event_id() -> str:
     generator = getattr(uuid, "uuid7", None)
     if callable(generator):
         return str(generator())
-    return str(uuid.uuid4())
+    return uuid4_str()
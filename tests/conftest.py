@@ -16,3 +16,9 @@ def sample_event():
 def temp_hilt_file(tmp_path):
     """Create a temporary HILT file path."""
     return tmp_path / "test.hilt.jsonl"
+
+
+@pytest.fixture
+def human_user():
+    """Create the human actor most tests write events for."""
+    return Actor(type="human", id="user")
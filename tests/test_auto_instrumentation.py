@@ -2,13 +2,15 @@
 
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from hilt import instrument, uninstrument
-from hilt.instrumentation.context import get_context
+from hilt.instrumentation.context import InstrumentationContext, get_context
 from hilt.io.session import Session
 
 
@@ -18,6 +20,48 @@ def temp_log_file(tmp_path: Path):
     return tmp_path / "test_auto.jsonl"
 
 
+@pytest.fixture
+def context() -> InstrumentationContext:
+    """Return the global instrumentation context singleton."""
+    return get_context()
+
+
+class _FakeMessage:
+    # l'instrumentor utilise _unwrap_message_content(message)
+    # qui sait extraire via .content
+    content = "Test response"
+
+
+class _FakeChoice:
+    message = _FakeMessage()
+
+
+class _FakeUsage:
+    prompt_tokens = 10
+    completion_tokens = 5
+    total_tokens = 15
+
+
+class _FakeResponse:
+    choices = [_FakeChoice()]
+    usage = _FakeUsage()
+
+
+class _FakeClient:
+    # headers au niveau client (fallback si pas d'extra_headers/env)
+    headers = {"OpenAI-Project": "proj_from_client_123"}
+
+
+class _FakeCompletions:
+    def __init__(self):
+        # le resource porte un _client que l'instrumentor peut inspecter
+        self._client = _FakeClient()
+
+    def create(self, *args, **kwargs):
+        # méthode d'origine (sera sauvegardée par l'instrumentor)
+        return _FakeResponse()
+
+
 @pytest.fixture
 def mock_openai():
     """
@@ -25,70 +69,42 @@ def mock_openai():
     - Expose chat_completions_module.Completions with a .create() method
     - Provide a fake client headers dict to carry OpenAI-Project
     - .create() returns a fake response with choices[0].message.content and usage
+
+    The fake SDK classes live at module level so they are defined once; a
+    fresh Completions subclass is handed out per test because the
+    instrumentor patches ``create`` on it.
     """
     with (
         patch("hilt.instrumentation.openai_instrumentor.OPENAI_AVAILABLE", True),
         patch("hilt.instrumentation.openai_instrumentor.chat_completions_module") as mock_module,
     ):
-
-        class _FakeMessage:
-            # l'instrumentor utilise _unwrap_message_content(message)
-            # qui sait extraire via .content
-            content = "Test response"
-
-        class _FakeChoice:
-            message = _FakeMessage()
-
-        class _FakeUsage:
-            prompt_tokens = 10
-            completion_tokens = 5
-            total_tokens = 15
-
-        class _FakeResponse:
-            choices = [_FakeChoice()]
-            usage = _FakeUsage()
-
-        class _FakeClient:
-            # headers au niveau client (fallback si pas d'extra_headers/env)
-            headers = {"OpenAI-Project": "proj_from_client_123"}
-
-        class Completions:
-            def __init__(self):
-                # le resource porte un _client que l’instrumentor peut inspecter
-                self._client = _FakeClient()
-
-            def create(self, *args, **kwargs):
-                # méthode d’origine (sera sauvegardée par l’instrumentor)
-                return _FakeResponse()
-
-        mock_module.Completions = Completions
+        mock_module.Completions = type("Completions", (_FakeCompletions,), {})
         yield mock_module  # permet d'accéder à la classe si besoin dans le test
 
 
 class TestAutoInstrumentation:
     """Tests for the instrument() function."""
 
-    def test_instrument_local_backend(self, temp_log_file: Path):
+    def test_instrument_local_backend(self, temp_log_file: Path, context: InstrumentationContext):
         uninstrument()
         _session = instrument(backend="local", filepath=str(temp_log_file))
-        context = get_context()
         assert context.is_instrumented
         assert context.session is not None
         assert context.session.backend == "local"
         uninstrument()
 
-    def test_instrument_with_filepath_only(self, temp_log_file: Path):
+    def test_instrument_with_filepath_only(
+        self, temp_log_file: Path, context: InstrumentationContext
+    ):
         uninstrument()
         _session = instrument(filepath=str(temp_log_file))
-        context = get_context()
         assert context.is_instrumented
         assert context.session.backend == "local"
         uninstrument()
 
-    def test_uninstrument(self, temp_log_file: Path):
+    def test_uninstrument(self, temp_log_file: Path, context: InstrumentationContext):
         uninstrument()
         instrument(backend="local", filepath=str(temp_log_file))
-        context = get_context()
         assert context.is_instrumented
         uninstrument()
         assert not context.is_instrumented
@@ -104,12 +120,11 @@ class TestAutoInstrumentation:
         with pytest.raises(ValueError):
             instrument()  # No backend or filepath
 
-    def test_multiple_instrument_calls(self, temp_log_file: Path):
+    def test_multiple_instrument_calls(self, temp_log_file: Path, context: InstrumentationContext):
         uninstrument()
         _ = instrument(backend="local", filepath=str(temp_log_file))
         temp_log_file2 = temp_log_file.parent / "test2.jsonl"
         session2 = instrument(backend="local", filepath=str(temp_log_file2))
-        context = get_context()
         assert context.session == session2
         uninstrument()
 
@@ -187,10 +202,9 @@ class TestContextManager:
         context2 = get_context()
         assert context1 is context2
 
-    def test_context_use_session(self, temp_log_file: Path):
+    def test_context_use_session(self, temp_log_file: Path, context: InstrumentationContext):
         uninstrument()
         global_session = instrument(backend="local", filepath=str(temp_log_file))
-        context = get_context()
         assert context.session == global_session
 
         temp_file = temp_log_file.parent / "temp.jsonl"
@@ -227,12 +241,11 @@ class TestProviderSelection:
 class TestThreadSafety:
     """Tests for thread safety."""
 
-    def test_context_thread_local(self, temp_log_file: Path):
+    def test_context_thread_local(self, temp_log_file: Path, context: InstrumentationContext):
         import threading
 
         uninstrument()
         global_session = instrument(backend="local", filepath=str(temp_log_file))
-        context = get_context()
 
         results = {}
 
@@ -247,6 +260,17 @@ class TestThreadSafety:
         uninstrument()
 
 
+class TestLazyImports:
+    """Tests for deferred provider SDK imports."""
+
+    def test_import_hilt_does_not_load_openai(self):
+        code = "import sys, hilt; print('openai' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
 @pytest.mark.integration
 class TestEndToEnd:
     """End-to-end integration tests."""
@@ -65,3 +65,25 @@ def test_event_to_dict(sample_event):
     assert event_dict["session_id"] == "sess_test"
     assert event_dict["actor"]["type"] == "human"
     assert event_dict["action"] == "prompt"
+
+
+def test_event_to_json_bytes(sample_event):
+    """Test UTF-8 bytes serialization matches the text form."""
+    sample_event.content = Content(text="Café ☕")
+
+    json_bytes = sample_event.to_json_bytes()
+    assert isinstance(json_bytes, bytes)
+    assert json_bytes.decode("utf-8") == sample_event.to_json()
+
+    event2 = Event.from_json(json_bytes)
+    assert event2.content is not None
+    assert event2.content.text == "Café ☕"
+
+
+def test_event_interns_action_and_actor_type():
+    """Closed-set string fields are interned so events share them."""
+    first = Event(session_id="s", actor=Actor(type="".join(["hu", "man"]), id="a"), action="prompt")
+    second = Event.from_json(first.to_json())
+
+    assert first.action is second.action
+    assert first.actor.type is second.actor.type
@@ -21,6 +21,30 @@ def test_verify_hash_failure() -> None:
     assert verify_hash("other", digest) is False
 
 
+def test_verify_hash_non_ascii_digest() -> None:
+    assert verify_hash("x", "sha256:é") is False
+    assert verify_hash("x", "sha256:\udc80") is False
+
+
 def test_verify_hash_invalid_prefix() -> None:
     with pytest.raises(ValueError):
         verify_hash("content", "md5:deadbeef")
+
+
+def test_hash_content_unsupported_algorithm() -> None:
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        hash_content("hello", algorithm="md5")
+
+
+def test_hash_content_blake3_round_trip() -> None:
+    pytest.importorskip("blake3")
+    digest = hash_content("hello", algorithm="blake3")
+    assert digest.startswith("blake3:")
+    assert verify_hash("hello", digest) is True
+    assert verify_hash("other", digest) is False
+
+
+def test_verify_hash_blake3_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("hilt.utils.hashing.blake3_module", None)
+    with pytest.raises(ImportError, match="pip install blake3"):
+        verify_hash("hello", "blake3:deadbeef")
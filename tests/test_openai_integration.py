@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from hilt.integrations.openai import (
+    _calculate_cost,
+    _extract_status_code,
+    _generate_conversation_uuid,
+    _usage_values,
+)
+
+_CONVERSATION_ID_RE = re.compile(r"conv_[0-9a-f]{12}")
+
+
+def test_usage_values_from_object() -> None:
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    assert _usage_values(usage) == (10, 5, 15)
+
+
+def test_usage_values_from_dict_and_partial_objects() -> None:
+    assert _usage_values({"prompt_tokens": 7, "total_tokens": 9}) == (7, 0, 9)
+    assert _usage_values(SimpleNamespace(prompt_tokens=3, completion_tokens=None)) == (3, 0, 0)
+
+
+def test_usage_values_missing_usage() -> None:
+    assert _usage_values(None) == (0, 0, 0)
+
+
+def test_generate_conversation_uuid_deterministic() -> None:
+    first = _generate_conversation_uuid("auto_123")
+    assert first == _generate_conversation_uuid("auto_123")
+    assert first != _generate_conversation_uuid("auto_456")
+
+
+def test_generate_conversation_uuid_format() -> None:
+    for key in ("auto_1", "session-abc", ""):
+        assert _CONVERSATION_ID_RE.fullmatch(_generate_conversation_uuid(key))
+
+
+def _create_rate_limit_error() -> Exception:
+    openai = pytest.importorskip("openai")
+    # A plain namespace is enough for the SDK to build the error; no MagicMock needed
+    response = SimpleNamespace(status_code=429, headers={}, request=None)
+    return openai.RateLimitError("Rate limit exceeded", response=response, body=None)
+
+
+def test_extract_status_code_rate_limit_error() -> None:
+    assert _extract_status_code(_create_rate_limit_error()) == 429
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Rate limit reached", 429),
+        ("Error code: 401 - invalid api key", 401),
+        ("Error code: 403", 403),
+        ("Error code: 400 - bad request", 400),
+        ("503 Service Unavailable", 503),
+        ("connection reset", 500),
+    ],
+)
+def test_extract_status_code_from_message(message: str, expected: int) -> None:
+    assert _extract_status_code(RuntimeError(message)) == expected
+
+
+def test_calculate_cost_known_and_fallback_models() -> None:
+    expected = (1000 * 0.150 / 1_000_000) + (500 * 0.600 / 1_000_000)
+    assert abs(_calculate_cost("gpt-4o-mini", 1000, 500) - expected) < 0.000001
+    assert _calculate_cost("unknown-model", 1000, 500) == _calculate_cost("gpt-4o-mini", 1000, 500)
+    assert abs(_calculate_cost("gpt-4o", 1_000_000, 0) - 2.50) < 0.000001
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from hilt.io.reader import _iter_chunked_lines, iter_jsonl_lines
+
+
+def test_iter_jsonl_lines_splits_on_newlines(tmp_path: Path) -> None:
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b'{"a": 1}\n{"b": 2}\n')
+
+    assert list(iter_jsonl_lines(path)) == [b'{"a": 1}', b'{"b": 2}']
+
+
+def test_chunked_lines_across_chunk_boundaries(tmp_path: Path) -> None:
+    path = tmp_path / "chunks.jsonl"
+    lines = [f'{{"index": {i}, "text": "événement"}}'.encode() for i in range(50)]
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    with path.open("rb") as f:
+        assert list(_iter_chunked_lines(f, chunk_size=7)) == lines
+    assert list(iter_jsonl_lines(path)) == lines
+
+
+def test_iter_jsonl_lines_keeps_unterminated_tail_and_blank_lines(tmp_path: Path) -> None:
+    path = tmp_path / "tail.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n{"b": 2}')
+
+    assert list(iter_jsonl_lines(path)) == [b'{"a": 1}', b"", b'{"b": 2}']
+
+
+def test_iter_jsonl_lines_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+
+    assert list(iter_jsonl_lines(path)) == []
+
+
+def test_iter_jsonl_lines_reads_pipes(tmp_path: Path) -> None:
+    fifo = tmp_path / "events.fifo"
+    if not hasattr(os, "mkfifo"):
+        pytest.skip("named pipes are not available on this platform")
+    os.mkfifo(fifo)
+
+    def writer() -> None:
+        with fifo.open("wb") as f:
+            f.write(b'{"a": 1}\n{"b": 2}\n')
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert list(iter_jsonl_lines(fifo)) == [b'{"a": 1}', b'{"b": 2}']
+    finally:
+        thread.join()
+
+
+def test_iter_jsonl_lines_survives_concurrent_truncation(tmp_path: Path) -> None:
+    path = tmp_path / "truncated.jsonl"
+    path.write_bytes(b'{"a": 1}\n' * 1000)
+
+    lines = iter_jsonl_lines(path, chunk_size=64)
+    assert next(lines) == b'{"a": 1}'
+    # Another process truncating the log must end iteration, not crash it
+    with path.open("w"):
+        pass
+    # Only what was already read can still come out (possibly a partial line)
+    assert len(list(lines)) < 10
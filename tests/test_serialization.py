@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from types import ModuleType
+
+import pytest
+
+from hilt.utils import serialization
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: float
+    y: float
+
+
+@pytest.fixture(params=["orjson", "json"])
+def impl(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """The serialization module with orjson, and a fresh copy with orjson blocked."""
+    if request.param == "orjson":
+        if not serialization.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        return serialization
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("_serialization_json", serialization.__file__)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert not module.ORJSON_AVAILABLE
+    return module
+
+
+def test_dumps_compact_utf8(impl: ModuleType) -> None:
+    assert impl.dumps({"text": "héllo", "n": [1, 2.5]}) == '{"text":"héllo","n":[1,2.5]}'.encode()
+    assert impl.dumps_line({"a": 1}) == b'{"a":1}\n'
+
+
+def test_dumps_floats_round_trip(impl: ModuleType) -> None:
+    # The exponent notation differs between orjson and json; the values do not
+    values = [1e-7, 1e20, 0.000015, 1.5e300, -2.5e-10, 0.1]
+    assert serialization.loads(impl.dumps(values)) == values
+
+
+def test_dumps_non_finite_floats_as_null(impl: ModuleType) -> None:
+    value = {"nan": float("nan"), "values": [float("inf"), -float("inf"), 1.0]}
+    assert impl.dumps(value) == b'{"nan":null,"values":[null,null,1.0]}'
+    assert impl.dumps_line(value) == b'{"nan":null,"values":[null,null,1.0]}\n'
+
+
+def test_dumps_big_integers(impl: ModuleType) -> None:
+    assert impl.dumps({"n": 2**70}) == b'{"n":1180591620717411303424}'
+    assert impl.dumps_line([-(2**64)]) == b"[-18446744073709551616]\n"
+
+
+def test_dumps_extended_types(impl: ModuleType) -> None:
+    value = {
+        "at": datetime(2024, 1, 2, 3, 4, 5, 6),
+        "id": uuid.UUID(int=1),
+        "color": _Color.RED,
+        "point": _Point(x=1.5, y=float("nan")),
+    }
+    assert impl.dumps(value) == (
+        b'{"at":"2024-01-02T03:04:05.000006",'
+        b'"id":"00000000-0000-0000-0000-000000000001",'
+        b'"color":"red","point":{"x":1.5,"y":null}}'
+    )
+
+
+def test_dumps_unsupported_type(impl: ModuleType) -> None:
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        impl.dumps({"value": object()})
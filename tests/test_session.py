@@ -3,19 +3,28 @@
 This file REPLACES the old test that assumed the local backend ignored `columns`.
 """
 
+import codecs
 import json
+import os
+import subprocess
+import sys
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from hilt import Actor, Content, Event, Metrics, Session
+from hilt import Actor, Content, Event, HILTError, Metrics, Session
+from hilt.core.event import RawEvent
+from hilt.io import clear_sheets_cache
+from hilt.io.session import ALL_COLUMNS
 
 # ============================================================================
 # NEW TESTS FOR LOCAL BACKEND COLUMN FILTERING
 # ============================================================================
 
 
-def test_session_local_backend_with_columns(temp_hilt_file: Path):
+def test_session_local_backend_with_columns(temp_hilt_file: Path, human_user: Actor):
     """Local backend accepts and uses columns parameter."""
     custom_columns = ["timestamp", "speaker", "action", "cost_usd"]
 
@@ -24,7 +33,7 @@ def test_session_local_backend_with_columns(temp_hilt_file: Path):
 
         event = Event(
             session_id="test_session",
-            actor=Actor(type="human", id="user"),
+            actor=human_user,
             action="prompt",
             content=Content(text="This is a secret message"),
             metrics=Metrics(cost_usd=0.00123),
@@ -48,13 +57,13 @@ def test_session_local_backend_with_columns(temp_hilt_file: Path):
     assert "metrics" not in data
 
 
-def test_session_local_backend_without_columns(temp_hilt_file: Path):
+def test_session_local_backend_without_columns(temp_hilt_file: Path, human_user: Actor):
     """Local backend writes full events when columns=None."""
     with Session(backend="local", filepath=temp_hilt_file) as session:
         assert session.columns is None
         event = Event(
             session_id="test_session",
-            actor=Actor(type="human", id="user"),
+            actor=human_user,
             action="prompt",
             content=Content(text="Full message content"),
             metrics=Metrics(cost_usd=0.00123),
@@ -76,7 +85,7 @@ def test_session_local_backend_without_columns(temp_hilt_file: Path):
     assert data["metrics"]["cost_usd_display"] == "0,001230 USD"
 
 
-def test_session_local_backend_excludes_message_column(temp_hilt_file: Path):
+def test_session_local_backend_excludes_message_column(temp_hilt_file: Path, human_user: Actor):
     """Message column can be excluded for privacy."""
     columns_no_message = [
         "timestamp",
@@ -92,7 +101,7 @@ def test_session_local_backend_excludes_message_column(temp_hilt_file: Path):
     with Session(backend="local", filepath=temp_hilt_file, columns=columns_no_message) as session:
         event = Event(
             session_id="sensitive_conv",
-            actor=Actor(type="human", id="user"),
+            actor=human_user,
             action="prompt",
             content=Content(text="This is sensitive private data that should NOT be logged!"),
             metrics=Metrics(
@@ -176,37 +185,36 @@ def test_session_local_backend_read_filtered_events(temp_hilt_file: Path):
     assert events[2].actor.id == "user_2"
 
 
-def test_session_local_backend_multiple_columns_combinations(temp_hilt_file: Path):
-    """Various column combinations should work."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "columns",
+    [
         ["timestamp", "action"],  # Minimal
         ["timestamp", "speaker", "action", "cost_usd", "model"],  # Metadata only
         ["timestamp", "message", "cost_usd"],  # With message
         ["timestamp", "tokens_in", "tokens_out", "cost_usd", "model"],  # Tokens & cost
-    ]
-
-    for columns in test_cases:
-        if temp_hilt_file.exists():
-            temp_hilt_file.unlink()
-
-        with Session(backend="local", filepath=temp_hilt_file, columns=columns) as session:
-            event = Event(
-                session_id="test",
-                actor=Actor(type="human", id="user"),
-                action="prompt",
-                content=Content(text="Test message"),
-                metrics=Metrics(
-                    tokens={"prompt": 10, "completion": 20, "total": 30}, cost_usd=0.00123
-                ),
-                extensions={"model": "gpt-4o-mini"},
-            )
-            session.append(event)
+    ],
+)
+def test_session_local_backend_multiple_columns_combinations(
+    temp_hilt_file: Path, columns: list[str], human_user: Actor
+):
+    """Various column combinations should work."""
+    with Session(backend="local", filepath=temp_hilt_file, columns=columns) as session:
+        event = Event(
+            session_id="test",
+            actor=human_user,
+            action="prompt",
+            content=Content(text="Test message"),
+            metrics=Metrics(tokens={"prompt": 10, "completion": 20, "total": 30}, cost_usd=0.00123),
+            extensions={"model": "gpt-4o-mini"},
+        )
+        session.append(event)
 
-        data = json.loads(temp_hilt_file.read_text().splitlines()[0])
-        assert set(data.keys()) == set(columns), f"Failed for columns: {columns}"
+    with temp_hilt_file.open("rb") as f:
+        data = json.loads(f.readline())
+    assert set(data.keys()) == set(columns), f"Failed for columns: {columns}"
 
 
-def test_session_local_backend_long_message_truncation(temp_hilt_file: Path):
+def test_session_local_backend_long_message_truncation(temp_hilt_file: Path, human_user: Actor):
     """Long messages are truncated to 500 chars in filtered mode."""
     custom_columns = ["timestamp", "message", "action"]
 
@@ -214,7 +222,7 @@ def test_session_local_backend_long_message_truncation(temp_hilt_file: Path):
         long_message = "A" * 600  # More than 500 chars
         event = Event(
             session_id="test",
-            actor=Actor(type="human", id="user"),
+            actor=human_user,
             action="prompt",
             content=Content(text=long_message),
         )
@@ -271,6 +279,44 @@ def test_session_local_backend_extensions_extraction(temp_hilt_file: Path):
     assert data["relevance_score"] == 0.95
 
 
+def test_session_local_backend_non_utf8_encoding(temp_hilt_file: Path, human_user: Actor):
+    """Sessions honour non-UTF-8 encodings on both write and read."""
+    with Session(backend="local", filepath=temp_hilt_file, encoding="latin-1") as session:
+        session.append(
+            Event(
+                session_id="encoded",
+                actor=human_user,
+                action="prompt",
+                content=Content(text="café"),
+            )
+        )
+
+    assert "café".encode("latin-1") in temp_hilt_file.read_bytes()
+    events = list(Session(temp_hilt_file, mode="r", encoding="latin-1").read())
+    assert events[0].content.text == "café"
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-8-sig"])
+def test_session_local_backend_bom_encoding(temp_hilt_file: Path, human_user: Actor, encoding: str):
+    """Encodings with a byte order mark write it once, across sessions."""
+    for texts in (["café", "naïve"], ["über"]):
+        with Session(backend="local", filepath=temp_hilt_file, encoding=encoding) as session:
+            for text in texts:
+                session.append(
+                    Event(
+                        session_id="encoded",
+                        actor=human_user,
+                        action="prompt",
+                        content=Content(text=text),
+                    )
+                )
+
+    bom = codecs.getincrementalencoder(encoding)().encode("")
+    assert temp_hilt_file.read_bytes().count(bom) == 1
+    events = list(Session(temp_hilt_file, mode="r", encoding=encoding).read())
+    assert [event.content.text for event in events] == ["café", "naïve", "über"]
+
+
 # ============================================================================
 # INTEGRATION-LIKE PARITY CHECK (no external services)
 # ============================================================================
@@ -295,3 +341,597 @@ def test_session_local_vs_sheets_column_parity(temp_hilt_file: Path):
     # Invalid column should fail for both
     with pytest.raises(ValueError, match="Invalid columns"):
         Session(backend="local", filepath=temp_hilt_file, columns=["invalid_column"])
+
+
+def test_local_session_does_not_import_sheets_dependencies(temp_hilt_file: Path):
+    """Local sessions never load gspread or google-auth."""
+    code = (
+        "import sys\n"
+        "from hilt import Session\n"
+        f"with Session({str(temp_hilt_file)!r}) as session:\n"
+        "    pass\n"
+        "print(any(m == 'gspread' or m.startswith('google.oauth2') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_session_sheet_row_matches_filtered_columns(temp_hilt_file: Path, human_user: Actor):
+    """Sheet rows hold the same column values as filtered local records, as strings."""
+    columns = ["action", "speaker", "tokens_in", "cost_usd", "model"]
+    session = Session(backend="local", filepath=temp_hilt_file, columns=columns)
+    event = Event(
+        session_id="parity",
+        actor=human_user,
+        action="prompt",
+        metrics=Metrics(tokens={"prompt": 12}, cost_usd=0.5),
+        extensions={"model": "gpt-4o-mini"},
+    )
+
+    row = session._event_to_sheet_row(event)
+    filtered = session._event_to_filtered_dict(event)
+
+    assert row == ["prompt", "human: user", "12", "0.500000", "gpt-4o-mini"]
+    assert list(filtered) == columns
+
+
+# ============================================================================
+# WRITE BUFFERING
+# ============================================================================
+
+
+def test_session_local_backend_buffered_writes(temp_hilt_file: Path):
+    """Buffered sessions hold events in memory until the buffer fills or closes."""
+    session = Session(backend="local", filepath=temp_hilt_file, buffer_size=1 << 16)
+    session.open()
+    for i in range(3):
+        session.append(
+            Event(
+                session_id="buffered",
+                actor=Actor(type="human", id=f"user_{i}"),
+                action="prompt",
+                content=Content(text=f"Message {i}"),
+            )
+        )
+
+    assert temp_hilt_file.read_bytes() == b""
+
+    session.close()
+
+    lines = temp_hilt_file.read_text().splitlines()
+    assert [json.loads(line)["actor"]["id"] for line in lines] == ["user_0", "user_1", "user_2"]
+
+
+def test_session_local_backend_unbuffered_by_default(temp_hilt_file: Path, human_user: Actor):
+    """Without a buffer, each appended event is written immediately."""
+    with Session(backend="local", filepath=temp_hilt_file) as session:
+        session.append(Event(session_id="direct", actor=human_user, action="prompt"))
+        assert len(temp_hilt_file.read_text().splitlines()) == 1
+
+
+def test_session_durability_fsyncs_on_close(temp_hilt_file: Path, monkeypatch, human_user: Actor):
+    """Durable sessions fsync the file once the buffered events are written."""
+    synced: list[int] = []
+    monkeypatch.setattr("hilt.io.session.os.fsync", synced.append)
+
+    with Session(backend="local", filepath=temp_hilt_file, durability=True) as session:
+        session.append(Event(session_id="durable", actor=human_user, action="prompt"))
+        assert synced == []
+
+    assert len(synced) == 1
+    assert len(temp_hilt_file.read_text().splitlines()) == 1
+
+
+def test_session_flush_writes_buffered_events(temp_hilt_file: Path, human_user: Actor):
+    """flush() writes buffered events while keeping the session open."""
+    with Session(backend="local", filepath=temp_hilt_file, buffer_size=1 << 16) as session:
+        session.append(Event(session_id="checkpoint", actor=human_user, action="prompt"))
+        assert temp_hilt_file.read_bytes() == b""
+
+        session.flush()
+        assert len(temp_hilt_file.read_text().splitlines()) == 1
+
+        session.append(Event(session_id="checkpoint", actor=human_user, action="completion"))
+
+    assert len(temp_hilt_file.read_text().splitlines()) == 2
+
+
+def test_session_recreates_removed_log_directory(tmp_path: Path, sample_event):
+    """Directories are created once, and again if they disappear later."""
+    log_file = tmp_path / "logs" / "nested" / "events.jsonl"
+    with Session(log_file) as session:
+        session.append(sample_event)
+    assert log_file.exists()
+
+    log_file.unlink()
+    log_file.parent.rmdir()
+
+    with Session(log_file) as session:
+        session.append(sample_event)
+    assert len(log_file.read_text().splitlines()) == 1
+
+
+def test_session_background_writes(temp_hilt_file: Path, human_user: Actor):
+    """A writer thread performs the writes; flush() and close() wait for it."""
+    with Session(backend="local", filepath=temp_hilt_file, background_writes=True) as session:
+        for i in range(20):
+            session.append(Event(session_id="bg", actor=human_user, action="prompt"))
+        session.append_many(
+            Event(session_id="bg", actor=human_user, action="completion") for _ in range(5)
+        )
+        session.flush()
+        assert len(temp_hilt_file.read_text().splitlines()) == 25
+        writer = session._writer_thread
+        assert writer is not None and writer.is_alive()
+
+    assert not writer.is_alive()
+    actions = [event.action for event in Session(temp_hilt_file, mode="r").read()]
+    assert actions == ["prompt"] * 20 + ["completion"] * 5
+
+
+def test_session_background_write_errors_surface(
+    temp_hilt_file: Path, human_user: Actor, monkeypatch
+):
+    """Failures in the writer thread are raised to the caller."""
+    session = Session(backend="local", filepath=temp_hilt_file, background_writes=True)
+    session.open()
+
+    def fail(self, encoded):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Session, "_write_now", fail)
+    session.append(Event(session_id="bg", actor=human_user, action="prompt"))
+
+    with pytest.raises(HILTError, match="disk full"):
+        session.flush()
+    session.close()
+
+
+def test_session_background_writes_continue_after_error(
+    temp_hilt_file: Path, human_user: Actor, monkeypatch
+):
+    """A failed write drops only its own payload; later events still reach disk."""
+    session = Session(backend="local", filepath=temp_hilt_file, background_writes=True)
+    session.open()
+    write_now = Session._write_now
+    calls = []
+
+    def fail_first(self, encoded):
+        calls.append(encoded)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        write_now(self, encoded)
+
+    monkeypatch.setattr(Session, "_write_now", fail_first)
+    session.append(Event(session_id="lost", actor=human_user, action="prompt"))
+    assert session._writer_queue is not None
+    session._writer_queue.join()
+
+    # The error belongs to the earlier event; this one is still queued and written
+    with pytest.raises(HILTError, match="1 earlier queued payload.*disk full"):
+        session.append(Event(session_id="kept-0", actor=human_user, action="prompt"))
+    for i in range(1, 4):
+        session.append(Event(session_id=f"kept-{i}", actor=human_user, action="prompt"))
+    session.close()
+
+    session_ids = [event.session_id for event in Session(temp_hilt_file, mode="r").read()]
+    assert session_ids == ["kept-0", "kept-1", "kept-2", "kept-3"]
+
+
+@pytest.mark.parametrize("short_write", [False, True])
+def test_session_failed_flush_keeps_buffered_events(
+    temp_hilt_file: Path, human_user: Actor, monkeypatch, short_write: bool
+):
+    """A failed write keeps the unwritten events buffered for the next flush."""
+    session = Session(backend="local", filepath=temp_hilt_file, buffer_size=1 << 20)
+    session.open()
+    for _ in range(5):
+        session.append(Event(session_id="retry", actor=human_user, action="prompt"))
+
+    write_some = Session._write_some
+    calls = []
+
+    def flaky(self, data):
+        calls.append(len(data))
+        if len(calls) == 1 and short_write:
+            return write_some(self, data[:10])
+        if len(calls) == 1 + short_write:
+            raise OSError("disk full")
+        return write_some(self, data)
+
+    monkeypatch.setattr(Session, "_write_some", flaky)
+    with pytest.raises(HILTError, match="disk full"):
+        session.flush()
+    session.close()
+
+    events = list(Session(temp_hilt_file, mode="r").read())
+    assert [event.session_id for event in events] == ["retry"] * 5
+
+
+@pytest.mark.parametrize("options", ["buffer_size=65536", "background_writes=True"])
+def test_session_buffered_events_written_at_exit(temp_hilt_file: Path, options: str):
+    """Buffered events of a session that is never closed are written at exit."""
+    code = (
+        "from hilt import Actor, Event, Session\n"
+        f"session = Session({str(temp_hilt_file)!r}, {options})\n"
+        "session.open()\n"
+        "for _ in range(3):\n"
+        "    session.append(Event(session_id='exit', actor=Actor(type='human', id='u'),"
+        " action='prompt'))\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    events = list(Session(temp_hilt_file, mode="r").read())
+    assert [event.session_id for event in events] == ["exit"] * 3
+
+
+def test_session_ignores_other_backend_settings(temp_hilt_file: Path, monkeypatch):
+    """Settings for one backend never reject a session of the other backend."""
+    monkeypatch.setenv("HILT_SHEETS_BATCH_SIZE", "0")
+    monkeypatch.setenv("HILT_BUFFER_SIZE", "-1")
+
+    assert Session(temp_hilt_file, buffer_size=4096).buffer_size == 4096
+    session, _ = _sheets_session(monkeypatch, sheets_batch_size=5)
+    assert session.sheets_batch_size == 5
+    with pytest.raises(ValueError, match="sheets_batch_size"):
+        _sheets_session(monkeypatch)
+    with pytest.raises(ValueError, match="buffer_size"):
+        Session(temp_hilt_file)
+
+
+def test_session_buffer_settings_from_environment(temp_hilt_file: Path, monkeypatch):
+    """Buffer settings fall back to HILT_* environment variables."""
+    monkeypatch.setenv("HILT_BUFFER_SIZE", "65536")
+    monkeypatch.setenv("HILT_FLUSH_INTERVAL_MS", "25")
+
+    session = Session(backend="local", filepath=temp_hilt_file)
+    assert session.buffer_size == 65536
+    assert session.flush_interval_ms == 25
+
+    explicit = Session(backend="local", filepath=temp_hilt_file, buffer_size=0)
+    assert explicit.buffer_size == 0
+
+
+def test_session_flush_interval_bounds_buffered_events(temp_hilt_file: Path, human_user: Actor):
+    """Appends write the buffer once it is older than flush_interval_ms."""
+    with Session(
+        backend="local", filepath=temp_hilt_file, buffer_size=1 << 20, flush_interval_ms=1
+    ) as session:
+        time.sleep(0.005)
+        session.append(Event(session_id="interval", actor=human_user, action="prompt"))
+        assert len(temp_hilt_file.read_text().splitlines()) == 1
+
+
+def test_session_invalid_buffer_size(temp_hilt_file: Path):
+    """Negative buffer sizes are rejected."""
+    with pytest.raises(ValueError, match="buffer_size"):
+        Session(backend="local", filepath=temp_hilt_file, buffer_size=-1)
+
+
+# ============================================================================
+# BATCH APPENDS
+# ============================================================================
+
+
+def test_session_append_many_preserves_order(temp_hilt_file: Path):
+    """append_many writes every event, in order, as complete lines."""
+    events = [
+        Event(session_id="batch", actor=Actor(type="human", id=f"user_{i}"), action="prompt")
+        for i in range(4)
+    ]
+    with Session(backend="local", filepath=temp_hilt_file) as session:
+        session.append_many(events)
+        session.append_many([])
+
+    read_back = list(Session(temp_hilt_file, mode="r").read())
+    assert [event.event_id for event in read_back] == [event.event_id for event in events]
+
+
+def test_session_append_many_with_columns(temp_hilt_file: Path):
+    """Batched events go through the same column filtering as append()."""
+    columns = ["action", "speaker"]
+    with Session(backend="local", filepath=temp_hilt_file, columns=columns) as session:
+        session.append_many(
+            Event(session_id="batch", actor=Actor(type="agent", id="bot"), action=action)
+            for action in ("completion", "retrieval")
+        )
+
+    rows = [json.loads(line) for line in temp_hilt_file.read_text().splitlines()]
+    assert rows == [
+        {"action": "completion", "speaker": "agent: bot"},
+        {"action": "retrieval", "speaker": "agent: bot"},
+    ]
+
+
+def test_session_append_many_bounds_batch_size(
+    temp_hilt_file: Path, human_user: Actor, monkeypatch
+):
+    """Large iterables are written in several bounded payloads, in order."""
+    monkeypatch.setattr("hilt.io.session.BATCH_MAX_BYTES", 1024)
+    payload_sizes: list[int] = []
+    write_encoded = Session._write_encoded
+
+    def spy(self: Session, encoded: bytes) -> None:
+        payload_sizes.append(len(encoded))
+        write_encoded(self, encoded)
+
+    monkeypatch.setattr(Session, "_write_encoded", spy)
+
+    with Session(backend="local", filepath=temp_hilt_file) as session:
+        session.append_many(
+            Event(session_id="bulk", actor=human_user, action="prompt", content={"text": str(i)})
+            for i in range(50)
+        )
+
+    assert len(payload_sizes) > 1
+    assert max(payload_sizes) < 1024 + 512
+    texts = [event.content.text for event in Session(temp_hilt_file, mode="r").read()]
+    assert texts == [str(i) for i in range(50)]
+
+
+def test_session_append_many_requires_open_session(temp_hilt_file: Path, sample_event):
+    """append_many fails like append() when the file is not open."""
+    session = Session(backend="local", filepath=temp_hilt_file)
+    with pytest.raises(HILTError, match="not opened"):
+        session.append_many([sample_event])
+
+
+# ============================================================================
+# SHEETS BATCHING (fake worksheet, no external services)
+# ============================================================================
+
+
+class _FakeWorksheet:
+    def __init__(self):
+        self.requests: list[list[list[str]]] = []
+        self.header_updates: list[list[str]] = []
+        self.header_reads = 0
+
+    def append_rows(self, rows, value_input_option=None):
+        self.requests.append(list(rows))
+
+    def row_values(self, row):
+        self.header_reads += 1
+        return self.header_updates[-1] if self.header_updates else []
+
+    def update(self, range_name, values):
+        self.header_updates.append(values[0])
+
+
+def _sheets_session(monkeypatch, **kwargs) -> tuple[Session, _FakeWorksheet]:
+    worksheet = _FakeWorksheet()
+
+    def init_sheets_backend(self, *args):
+        self.worksheet = worksheet
+
+    monkeypatch.setattr(Session, "_init_sheets_backend", init_sheets_backend)
+    return Session(backend="sheets", columns=["action"], **kwargs), worksheet
+
+
+def test_session_sheets_realtime_by_default(monkeypatch, human_user: Actor):
+    """Without batching, every event is sent in its own request."""
+    session, worksheet = _sheets_session(monkeypatch)
+    for action in ("prompt", "completion"):
+        session.append(Event(session_id="sheets", actor=human_user, action=action))
+
+    assert worksheet.requests == [[["prompt"]], [["completion"]]]
+
+
+def test_session_sheets_batches_rows(monkeypatch, human_user: Actor):
+    """Batched sheets sessions send full batches and the remainder on close."""
+    session, worksheet = _sheets_session(monkeypatch, sheets_batch_size=2)
+    for action in ("prompt", "completion", "retrieval"):
+        session.append(Event(session_id="sheets", actor=human_user, action=action))
+
+    assert worksheet.requests == [[["prompt"], ["completion"]]]
+
+    session.close()
+
+    assert worksheet.requests == [[["prompt"], ["completion"]], [["retrieval"]]]
+
+
+def test_session_sheets_append_many_keeps_order(monkeypatch, human_user: Actor):
+    """append_many sends pending single rows together with the batch, in order."""
+    session, worksheet = _sheets_session(monkeypatch, sheets_batch_size=10)
+    session.append(Event(session_id="sheets", actor=human_user, action="prompt"))
+    session.append_many(
+        Event(session_id="sheets", actor=human_user, action=action)
+        for action in ("retrieval", "completion")
+    )
+
+    assert worksheet.requests == [[["prompt"], ["retrieval"], ["completion"]]]
+
+
+def test_session_sheets_retries_failed_batch(monkeypatch, human_user: Actor):
+    """Rows from a failed append stay pending and are sent with the next request."""
+    session, worksheet = _sheets_session(monkeypatch, sheets_batch_size=2)
+    append_rows = worksheet.append_rows
+    failures = ["quota exceeded"]
+
+    def flaky_append_rows(rows, value_input_option=None):
+        if failures:
+            raise RuntimeError(failures.pop())
+        append_rows(rows, value_input_option)
+
+    worksheet.append_rows = flaky_append_rows
+    session.append(Event(session_id="sheets", actor=human_user, action="prompt"))
+    with pytest.raises(HILTError, match="quota exceeded"):
+        session.append(Event(session_id="sheets", actor=human_user, action="completion"))
+
+    session.append_many([Event(session_id="sheets", actor=human_user, action="retrieval")])
+
+    assert worksheet.requests == [[["prompt"], ["completion"], ["retrieval"]]]
+
+
+def test_session_sheets_bounds_pending_rows(monkeypatch, human_user: Actor):
+    """During an outage only the newest pending rows are kept for retry."""
+    monkeypatch.setattr("hilt.io.session.SHEETS_MAX_PENDING_ROWS", 2)
+    session, worksheet = _sheets_session(monkeypatch)
+    append_rows = worksheet.append_rows
+    outage = [True]
+
+    def flaky_append_rows(rows, value_input_option=None):
+        if outage[0]:
+            raise RuntimeError("service unavailable")
+        append_rows(rows, value_input_option)
+
+    worksheet.append_rows = flaky_append_rows
+    for action in ("prompt", "completion"):
+        with pytest.raises(HILTError, match="service unavailable"):
+            session.append(Event(session_id="sheets", actor=human_user, action=action))
+    with pytest.raises(HILTError, match="dropped 1 oldest pending rows"):
+        session.append(Event(session_id="sheets", actor=human_user, action="retrieval"))
+
+    outage[0] = False
+    session.append(Event(session_id="sheets", actor=human_user, action="tool_call"))
+
+    assert worksheet.requests == [[["completion"], ["retrieval"], ["tool_call"]]]
+
+
+class _FakeGspread:
+    """Minimal stand-in for the gspread and google-auth entry points Session uses."""
+
+    exceptions = SimpleNamespace(
+        SpreadsheetNotFound=type("SpreadsheetNotFound", (Exception,), {}),
+        WorksheetNotFound=type("WorksheetNotFound", (Exception,), {}),
+    )
+
+    def __init__(self):
+        self.authorize_calls = 0
+        self.open_calls = 0
+        self.worksheet = _FakeWorksheet()
+        self.Credentials = SimpleNamespace(
+            from_service_account_file=lambda path, scopes: ("creds", path),
+            from_service_account_info=lambda info, scopes: ("creds", info),
+        )
+
+    def authorize(self, creds):
+        self.authorize_calls += 1
+        return self
+
+    def open_by_key(self, sheet_id):
+        self.open_calls += 1
+        return SimpleNamespace(worksheet=lambda name: self.worksheet)
+
+
+@pytest.fixture
+def fake_gspread(monkeypatch):
+    fake = _FakeGspread()
+    monkeypatch.setitem(sys.modules, "gspread", fake)
+    monkeypatch.setitem(
+        sys.modules, "google.oauth2.service_account", SimpleNamespace(Credentials=fake.Credentials)
+    )
+    clear_sheets_cache()
+    yield fake
+    clear_sheets_cache()
+
+
+def test_session_sheets_reuses_client_and_worksheet(fake_gspread):
+    """Sessions for the same sheet reuse the authorized client and worksheet."""
+    for _ in range(3):
+        session = Session(backend="sheets", sheet_id="sheet", credentials_path="creds.json")
+        assert session.worksheet is fake_gspread.worksheet
+
+    assert fake_gspread.authorize_calls == 1
+    assert fake_gspread.open_calls == 1
+
+    Session(backend="sheets", sheet_id="other", credentials_path="creds.json")
+    assert fake_gspread.authorize_calls == 1
+    assert fake_gspread.open_calls == 2
+
+
+def test_session_sheets_checks_headers_once(fake_gspread):
+    """The header row is read and written once per sheet and column selection."""
+    for _ in range(3):
+        Session(backend="sheets", sheet_id="sheet", credentials_path="creds.json")
+
+    worksheet = fake_gspread.worksheet
+    assert worksheet.header_reads == 1
+    assert worksheet.header_updates == [ALL_COLUMNS]
+
+    Session(backend="sheets", sheet_id="sheet", credentials_path="creds.json", columns=["action"])
+    assert worksheet.header_reads == 2
+    assert worksheet.header_updates == [ALL_COLUMNS, ["action"]]
+
+
+def test_session_sheets_client_cache_tracks_credentials(fake_gspread, tmp_path: Path):
+    """Rewritten credential files and distinct inline credentials get their own client."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text("{}")
+    Session(backend="sheets", sheet_id="sheet", credentials_path=str(creds_file))
+    Session(backend="sheets", sheet_id="sheet", credentials_path=str(creds_file))
+    assert fake_gspread.authorize_calls == 1
+
+    stat = creds_file.stat()
+    os.utime(creds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    Session(backend="sheets", sheet_id="sheet", credentials_path=str(creds_file))
+    assert fake_gspread.authorize_calls == 2
+
+    for key in ("first", "second", "second"):
+        Session(backend="sheets", sheet_id="sheet", credentials_json={"private_key": key})
+    assert fake_gspread.authorize_calls == 4
+
+
+def test_session_sheets_failure_evicts_worksheet(fake_gspread):
+    """A failed sheets API call makes the next session reopen the worksheet."""
+    session = Session(
+        backend="sheets", sheet_id="sheet", credentials_path="creds.json", columns=["action"]
+    )
+
+    def fail(rows, value_input_option=None):
+        raise RuntimeError("worksheet deleted")
+
+    session.worksheet.append_rows = fail
+    with pytest.raises(HILTError, match="worksheet deleted"):
+        session.append(
+            Event(session_id="sheets", actor=Actor(type="human", id="alice"), action="prompt")
+        )
+
+    Session(backend="sheets", sheet_id="sheet", credentials_path="creds.json", columns=["action"])
+    assert fake_gspread.open_calls == 2
+    assert fake_gspread.worksheet.header_reads == 2
+
+
+# ============================================================================
+# RAW READS
+# ============================================================================
+
+
+def test_session_read_raw_events(temp_hilt_file: Path):
+    """read_raw yields unvalidated slotted records that convert back to Events."""
+    with Session(backend="local", filepath=temp_hilt_file) as session:
+        session.append(
+            Event(
+                session_id="raw",
+                actor=Actor(type="agent", id="assistant"),
+                action="completion",
+                content=Content(text="Hello"),
+                metrics=Metrics(tokens={"prompt": 3, "completion": 5}, cost_usd=0.0001),
+            )
+        )
+
+    records = list(Session(backend="local", filepath=temp_hilt_file, mode="r").read_raw())
+
+    assert len(records) == 1
+    record = records[0]
+    assert isinstance(record, RawEvent)
+    assert not hasattr(record, "__dict__")
+    assert record.session_id == "raw"
+    assert record.actor["id"] == "assistant"
+    assert record.metrics is not None
+    assert record.metrics["tokens"]["completion"] == 5
+
+    event = record.to_event()
+    assert event.content is not None
+    assert event.content.text == "Hello"
+    assert event.metrics is not None
+    assert event.metrics.cost_usd == pytest.approx(0.0001)
+
+
+def test_session_read_raw_requires_full_events(temp_hilt_file: Path):
+    """Filtered sessions cannot be read as raw events."""
+    session = Session(backend="local", filepath=temp_hilt_file, columns=["timestamp", "action"])
+    with pytest.raises(HILTError, match="read_raw"):
+        list(session.read_raw())
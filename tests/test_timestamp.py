@@ -16,6 +16,14 @@ def test_now_iso8601_format() -> None:
     assert datetime_obj.tzinfo == UTC
 
 
+def test_now_iso8601_tracks_clock() -> None:
+    before = datetime.now(UTC)
+    stamp = now_iso8601()
+    after = datetime.now(UTC)
+    assert len(stamp) == len("2025-10-08T14:30:45.123456Z")
+    assert before <= parse_timestamp(stamp) <= after
+
+
 def test_parse_timestamp_round_trip() -> None:
     original = "2025-10-08T14:30:45.123Z"
     parsed = parse_timestamp(original)
@@ -29,3 +37,12 @@ def test_parse_timestamp_round_trip() -> None:
 def test_parse_timestamp_rejects_empty() -> None:
     with pytest.raises(ValueError):
         parse_timestamp("")
+
+
+def test_parse_timestamp_caches_results() -> None:
+    stamp = "2025-10-08T14:30:45.123456Z"
+    assert parse_timestamp(stamp) is parse_timestamp(stamp)
+    with pytest.raises(ValueError):
+        parse_timestamp("not a timestamp")
+    with pytest.raises(ValueError):
+        parse_timestamp("not a timestamp")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from hilt.utils.uuid import generate_event_id
+from hilt.utils.uuid import generate_event_id, uuid4_str
 
 
 def test_generate_event_id_returns_valid_uuid() -> None:
@@ -17,3 +17,12 @@ def test_generate_event_id_unique() -> None:
     second = generate_event_id()
 
     assert first != second
+
+
+def test_uuid4_str_is_rfc4122_version_4() -> None:
+    for _ in range(100):
+        value = uuid4_str()
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122